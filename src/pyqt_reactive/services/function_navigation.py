@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import ClassVar, Mapping, Optional
 
-from objectstate import DottedFieldPath
-
 
 class FunctionPatternField:
     """Nominal owner for function-pattern parent-field semantics."""
@@ -14,6 +13,12 @@ class FunctionPatternField:
     name: ClassVar[str] = "func"
     token_field_prefix: ClassVar[str] = "func.token:"
     target_delimiter: ClassVar[str] = "|"
+    # Same ownership as DottedFieldPath(name).contains_path, folded into one
+    # startswith call for the navigation hot path.
+    _owned_path_prefixes: ClassVar[tuple[str, ...]] = (
+        f"{name}.",
+        f"{name}[",
+    )
 
     @classmethod
     def parameter_name(cls) -> str:
@@ -37,10 +42,7 @@ class FunctionPatternField:
 
         if not isinstance(field_path, str):
             return False
-        return (
-            DottedFieldPath(cls.parameter_name()).contains_path(field_path)
-            or field_path.startswith(cls.token_field_prefix)
-        )
+        return field_path == cls.name or field_path.startswith(cls._owned_path_prefixes)
 
 
 FUNCTION_FIELD_ROOT = FunctionPatternField.parameter_name()
@@ -77,8 +79,13 @@ def build_function_token_field_path(
     )
 
 
+@lru_cache(maxsize=256)
 def parse_function_field_target(field_path: str) -> FunctionFieldTarget:
-    """Parse function field path into token/index/base components."""
+    """Parse function field path into token/index/base components.
+
+    Navigation replays the same few paths; targets are frozen, so parses are
+    memoized and shared.
+    """
     normalized = field_path.strip()
     token: Optional[str] = None
 
@@ -70,15 +70,6 @@ class FunctionPatternRoundTripError(RuntimeError):
     """Raised when a function-pattern code document cannot be serviced."""
 
 
-@dataclass(frozen=True, slots=True)
-class TokenizedFunctionEntry:
-    """Function pattern entry paired with its stable ObjectState token."""
-
-    func: FunctionAuthority
-    kwargs: FunctionKwargs
-    token: str
-
-
 @dataclass(frozen=True, slots=True)
 class FunctionPatternValue:
     """Current callable and kwargs for one stable function token."""
@@ -278,7 +269,8 @@ class FunctionPatternCodeDocumentService:
         kwargs: Mapping[str, ParameterValue] | None,
     ) -> FunctionKwargs:
         """Validate kwargs and reject internal scope-token metadata."""
-        if kwargs is None:
+        if not kwargs:
+            # None or empty: the common case for pattern entries without kwargs.
             return {}
         if PatternScopeToken.key_in(kwargs):
             raise FunctionPatternRoundTripError(
@@ -525,80 +517,82 @@ class FunctionPatternCodeDocumentService:
         return left is right or left == right
 
     @classmethod
-    def iter_tokenized_entries(
+    def function_values_by_token(
         cls,
         pattern: FunctionPatternList | FunctionPatternByKey,
         tokens: PatternTokens,
-    ) -> list[TokenizedFunctionEntry]:
-        """Return flat (func, kwargs, token) entries from pattern + tokens."""
-        entries: list[TokenizedFunctionEntry] = []
+    ) -> dict[str, FunctionPatternValue]:
+        """Index a pattern's tokenized entries by token, with sanitized kwargs.
+
+        Entries without a sidecar token have no ObjectState and are skipped.
+        """
         if isinstance(pattern, dict):
             token_map = tokens if isinstance(tokens, dict) else {}
-            for channel_key, items in pattern.items():
-                channel_items = items if isinstance(items, list) else [items]
-                channel_tokens = token_map.get(str(channel_key), [])
-                for index, item in enumerate(channel_items):
+            groups = (
+                (items, token_map.get(str(channel_key), []))
+                for channel_key, items in pattern.items()
+            )
+        else:
+            groups = ((pattern, tokens if isinstance(tokens, list) else []),)
+
+        values: dict[str, FunctionPatternValue] = {}
+        for items, group_tokens in groups:
+            item_list = items if isinstance(items, list) else [items]
+            for item, token in zip(item_list, group_tokens):
+                if not token:
+                    continue
+                if (
+                    isinstance(item, tuple)
+                    and len(item) == 2
+                    and isinstance(item[1], dict)
+                    and callable(item[0])
+                ):
+                    # Canonical (callable, kwargs) entry.
+                    entry = item[0], cls.sanitize_pattern_kwargs(item[1])
+                else:
                     entry = cls.function_and_kwargs(item)
                     if entry is None:
                         continue
-                    token = (
-                        str(channel_tokens[index])
-                        if index < len(channel_tokens) and channel_tokens[index]
-                        else ""
-                    )
-                    entries.append(
-                        TokenizedFunctionEntry(
-                            func=entry[0],
-                            kwargs=entry[1],
-                            token=token,
-                        )
-                    )
-            return entries
+                # Both branches yield sanitized kwargs; no second pass needed.
+                values[str(token)] = FunctionPatternValue(*entry)
+        return values
 
-        item_list = pattern if isinstance(pattern, list) else [pattern]
-        token_list = tokens if isinstance(tokens, list) else []
-        for index, item in enumerate(item_list):
-            entry = cls.function_and_kwargs(item)
-            if entry is None:
-                continue
-            token = (
-                str(token_list[index])
-                if index < len(token_list) and token_list[index]
-                else ""
-            )
-            entries.append(
-                TokenizedFunctionEntry(
-                    func=entry[0],
-                    kwargs=entry[1],
-                    token=token,
-                )
-            )
-        return entries
+    @staticmethod
+    def normalized_values_by_token(
+        items: FunctionPatternList,
+        tokens: list[str],
+    ) -> dict[str, FunctionPatternValue]:
+        """Index entries from normalize_function_list by their aligned tokens.
+
+        Normalized entries are already (callable, sanitized kwargs) pairs, so no
+        re-extraction or re-validation is needed.
+        """
+        return {
+            token: FunctionPatternValue(func, kwargs)
+            for (func, kwargs), token in zip(items, tokens)
+        }
 
     def update_function_object_states(
         self,
         *,
         parent_scope_id: str | None,
-        old_entries: list[TokenizedFunctionEntry],
-        new_entries: list[TokenizedFunctionEntry],
+        old_by_token: dict[str, FunctionPatternValue],
+        new_by_token: dict[str, FunctionPatternValue],
     ) -> None:
         """Update existing function ObjectStates from a code-mode edit."""
         if not parent_scope_id:
             return
 
-        old_by_token = self._entry_map(old_entries)
-        new_by_token = self._entry_map(new_entries)
-
-        for token in set(old_by_token) - set(new_by_token):
-            self.unregister_function_state(parent_scope_id, token)
-
-        for token in set(old_by_token) & set(new_by_token):
-            old_value = old_by_token[token]
-            new_value = new_by_token[token]
+        get_by_scope = ObjectStateRegistry.get_by_scope
+        for token, old_value in old_by_token.items():
+            new_value = new_by_token.get(token)
+            if new_value is None:
+                self.unregister_function_state(parent_scope_id, token)
+                continue
             scope_id = f"{parent_scope_id}::{token}"
 
             if old_value.func is not new_value.func:
-                parent_state = ObjectStateRegistry.get_by_scope(parent_scope_id)
+                parent_state = get_by_scope(parent_scope_id)
                 if parent_state is None:
                     raise FunctionPatternRoundTripError(
                         f"Missing parent ObjectState for {parent_scope_id!r}."
@@ -610,7 +604,7 @@ class FunctionPatternCodeDocumentService:
                 )
                 continue
 
-            state = ObjectStateRegistry.get_by_scope(scope_id)
+            state = get_by_scope(scope_id)
             if state is None:
                 continue
 
@@ -620,22 +614,6 @@ class FunctionPatternCodeDocumentService:
                 next_kwargs=new_value.kwargs,
             )
 
-    @staticmethod
-    def _entry_map(
-        entries: list[TokenizedFunctionEntry],
-    ) -> dict[str, FunctionPatternValue]:
-        entry_map: dict[str, FunctionPatternValue] = {}
-        for entry in entries:
-            if not entry.token:
-                continue
-            entry_map[entry.token] = FunctionPatternValue(
-                entry.func,
-                FunctionPatternCodeDocumentService.sanitize_pattern_kwargs(
-                    entry.kwargs
-                ),
-            )
-        return entry_map
-
     @classmethod
     def apply_kwargs_to_state(
         cls,
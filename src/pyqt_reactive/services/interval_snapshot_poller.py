@@ -27,6 +27,14 @@ class IntervalSnapshotPollerPolicyABC(ABC, Generic[TSnapshot]):
     def poll_interval_seconds(self) -> float:
         return 1.0
 
+    def snapshot_changed(self, previous: TSnapshot | None, current: TSnapshot) -> bool:
+        """Return whether ``current`` differs from the last stored snapshot.
+
+        Override when snapshots carry a cheap identity (port, generation, ...)
+        that makes a full structural comparison unnecessary.
+        """
+        return current is not previous and current != previous
+
     def on_snapshot_changed(self, snapshot: TSnapshot) -> None:
         pass
 
@@ -45,6 +53,7 @@ class CallbackIntervalSnapshotPollerPolicy(
     poll_interval_seconds_value: float = 1.0
     on_snapshot_changed_fn: Callable[[TSnapshot], None] | None = None
     on_poll_error_fn: Callable[[Exception], None] | None = None
+    snapshot_changed_fn: Callable[[TSnapshot | None, TSnapshot], bool] | None = None
 
     def fetch_snapshot(self) -> TSnapshot:
         return self.fetch_snapshot_fn()
@@ -56,6 +65,11 @@ class CallbackIntervalSnapshotPollerPolicy(
     def poll_interval_seconds(self) -> float:
         return self.poll_interval_seconds_value
 
+    def snapshot_changed(self, previous: TSnapshot | None, current: TSnapshot) -> bool:
+        if self.snapshot_changed_fn is not None:
+            return self.snapshot_changed_fn(previous, current)
+        return super().snapshot_changed(previous, current)
+
     def on_snapshot_changed(self, snapshot: TSnapshot) -> None:
         if self.on_snapshot_changed_fn is not None:
             self.on_snapshot_changed_fn(snapshot)
@@ -124,7 +138,7 @@ class IntervalSnapshotPoller(Generic[TSnapshot]):
             with self._lock:
                 if generation != self._generation:
                     return
-                changed = snapshot != self._snapshot
+                changed = self._policy.snapshot_changed(self._snapshot, snapshot)
                 self._snapshot = snapshot
             if changed:
                 self._policy.on_snapshot_changed(self._policy.clone_snapshot(snapshot))
@@ -26,14 +26,15 @@ Example Usage:
 """
 
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Dict, Callable, Optional
 from PyQt6 import sip
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QCursor, QGuiApplication
-from PyQt6.QtCore import QRect
+from PyQt6.QtGui import QCursor, QGuiApplication, QScreen
+from PyQt6.QtCore import QEvent, QObject, QPoint, QRect, Qt
 from PyQt6.QtWidgets import QApplication, QMainWindow
 from PyQt6.QtCore import QTimer
 
@@ -41,6 +42,7 @@ from pyqt_reactive.services.window_navigation import (
     NullWindowNavigationDriver,
     RegisteredWindowNavigationRequest,
     WindowNavigationDriver,
+    window_flash_overlay_type,
 )
 
 if TYPE_CHECKING:
@@ -48,6 +50,91 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Navigation capabilities are resolved once into driver objects at registration;
+# scopes without navigation all share this stateless driver.
+_NULL_NAVIGATION_DRIVER = NullWindowNavigationDriver()
+
+
+def _inclusive_edges(rect: QRect) -> tuple[int, int, int, int] | None:
+    """Return ``rect`` as inclusive (left, top, right, bottom) edges, or None if empty."""
+    if rect.isEmpty():
+        return None
+    return (rect.left(), rect.top(), rect.right(), rect.bottom())
+
+
+@lru_cache(maxsize=64)
+def _solve_window_position(
+    cursor: tuple[int, int],
+    offset: int,
+    size: tuple[int, int],
+    bounds: tuple[int, int, int, int],
+    obstacles: tuple[tuple[int, int, int, int], ...],
+    avoid_rects: tuple[tuple[int, int, int, int], ...],
+) -> tuple[int, int]:
+    """Pick a clamped top-left for a window centred on ``cursor``.
+
+    ``bounds`` holds the (left, top, max_x, max_y) clamp limits. Rects are
+    inclusive edges, matching QRect.intersects/contains. Reopening a window
+    over an unchanged layout resolves from the cache.
+    """
+    cursor_x, cursor_y = cursor
+    width, height = size
+    bounds_left, bounds_top, max_x, max_y = bounds
+    base_x = cursor_x - (width // 2) + offset
+    base_y = cursor_y - (height // 2) + offset
+    if width <= 0 or height <= 0:
+        obstacles = ()
+
+    def intersects_any(x: int, y: int) -> bool:
+        right = x + width - 1
+        bottom = y + height - 1
+        for other_left, other_top, other_right, other_bottom in obstacles:
+            if not (
+                right < other_left
+                or other_right < x
+                or bottom < other_top
+                or other_bottom < y
+            ):
+                return True
+        return False
+
+    def iter_candidates() -> Iterator[tuple[int, int]]:
+        """Yield placement candidates lazily so the search stops at the first fit."""
+        gap = 12
+        for left, top, right, bottom in avoid_rects:
+            if left <= cursor_x <= right and top <= cursor_y <= bottom:
+                yield (right + gap, cursor_y - (height // 2))
+                yield (left - width - gap, cursor_y - (height // 2))
+                yield (cursor_x - (width // 2), bottom + gap)
+                yield (cursor_x - (width // 2), top - height - gap)
+                break
+        else:
+            yield (base_x, base_y)
+
+        step = 32
+        rings = 12
+        for r in range(1, rings + 1):
+            delta = r * step
+            yield (base_x + delta, base_y)
+            yield (base_x - delta, base_y)
+            yield (base_x, base_y + delta)
+            yield (base_x, base_y - delta)
+            yield (base_x + delta, base_y + delta)
+            yield (base_x + delta, base_y - delta)
+            yield (base_x - delta, base_y + delta)
+            yield (base_x - delta, base_y - delta)
+
+    for candidate_x, candidate_y in iter_candidates():
+        x = min(max(candidate_x, bounds_left), max_x)
+        y = min(max(candidate_y, bounds_top), max_y)
+        if not intersects_any(x, y):
+            return (x, y)
+
+    return (
+        min(max(base_x, bounds_left), max_x),
+        min(max(base_y, bounds_top), max_y),
+    )
+
 
 class WindowLookupStatus(Enum):
     PRESENT = "present"
@@ -67,6 +154,15 @@ class WindowLookupResult:
         return self.status is WindowLookupStatus.PRESENT and self.window is not None
 
 
+@dataclass(frozen=True, slots=True)
+class _ScopedWindowEntry:
+    """Registered window for one scope together with its resolved drivers."""
+
+    window: QWidget
+    navigation_driver: WindowNavigationDriver = _NULL_NAVIGATION_DRIVER
+    code_document_driver: "WindowCodeDocumentDriver | None" = None
+
+
 class NavigationRetryScheduler:
     """Schedule bounded navigation retries while forms/lists finish building."""
 
@@ -105,15 +201,11 @@ class NavigationRetryScheduler:
         request: RegisteredWindowNavigationRequest,
         retry_counts: Dict[int, int],
     ) -> None:
-        window_key = id(request.window)
-        if window_key in retry_counts:
-            del retry_counts[window_key]
+        retry_counts.pop(id(request.window), None)
 
     @staticmethod
     def _retry_count(window_key: int, retry_counts: Dict[int, int]) -> int:
-        if window_key in retry_counts:
-            return retry_counts[window_key]
-        return 0
+        return retry_counts.get(window_key, 0)
 
     @classmethod
     def _register_build_callback(
@@ -125,8 +217,18 @@ class NavigationRetryScheduler:
         if len(callback_lists) == 0:
             return False
 
+        # One retry closure is shared by every pending build list (root and
+        # nested managers); only the first build completion re-arms navigation.
+        armed = True
+
         def retry_after_build() -> None:
-            QTimer.singleShot(cls.RETRY_DELAY_MS, check_and_navigate)
+            nonlocal armed
+            if not armed:
+                return
+            armed = False
+            # The build has finished; retry on the next event-loop turn (after
+            # the post-build sequence unwinds) instead of a fixed polling delay.
+            QTimer.singleShot(0, check_and_navigate)
 
         registered = False
         for callbacks in callback_lists:
@@ -137,6 +239,24 @@ class NavigationRetryScheduler:
         return registered
 
 
+class _ScopeCloseWatcher(QObject):
+    """Unregister a scope when its window receives a close event.
+
+    Installed as an event filter (and parented to the window) instead of
+    rebinding ``closeEvent`` on the instance, so Qt's virtual dispatch is left
+    intact and no per-window closure over the original handler is retained.
+    """
+
+    def __init__(self, scope_id: str, window: QWidget) -> None:
+        super().__init__(window)
+        self._scope_id = scope_id
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Close:
+            WindowManager.unregister_window(self._scope_id, watched)
+        return False
+
+
 class WindowManager:
     """Global registry for scoped windows with navigation support.
 
@@ -151,10 +271,9 @@ class WindowManager:
     """
 
     # Global registry of open windows by scope_id
-    _scoped_windows: Dict[str, QWidget] = {}
-    _navigation_drivers: Dict[str, WindowNavigationDriver] = {}
-    _code_document_drivers: Dict[str, "WindowCodeDocumentDriver"] = {}
+    _scoped_windows: Dict[str, _ScopedWindowEntry] = {}
     _navigation_retry_counts: Dict[int, int] = {}
+    _last_placement_screen: QScreen | None = None
 
     @classmethod
     def _resolve_registered_window(
@@ -163,9 +282,10 @@ class WindowManager:
         *,
         require_visible: bool = False,
     ) -> WindowLookupResult:
-        if scope_id not in cls._scoped_windows:
+        entry = cls._scoped_windows.get(scope_id)
+        if entry is None:
             return WindowLookupResult(scope_id, WindowLookupStatus.MISSING)
-        window = cls._scoped_windows[scope_id]
+        window = entry.window
 
         if sip.isdeleted(window):
             result = WindowLookupResult(scope_id, WindowLookupStatus.STALE)
@@ -186,9 +306,44 @@ class WindowManager:
 
     @classmethod
     def _navigation_driver(cls, scope_id: str) -> WindowNavigationDriver:
-        if scope_id in cls._navigation_drivers:
-            return cls._navigation_drivers[scope_id]
-        return NullWindowNavigationDriver()
+        entry = cls._scoped_windows.get(scope_id)
+        if entry is None:
+            return _NULL_NAVIGATION_DRIVER
+        return entry.navigation_driver
+
+    @classmethod
+    def _store_entry(
+        cls,
+        scope_id: str,
+        window: QWidget,
+        navigation_driver: WindowNavigationDriver | None,
+        code_document_driver: "WindowCodeDocumentDriver | None",
+    ) -> None:
+        cls._scoped_windows[scope_id] = _ScopedWindowEntry(
+            window,
+            _NULL_NAVIGATION_DRIVER if navigation_driver is None else navigation_driver,
+            code_document_driver,
+        )
+
+    @classmethod
+    def _placement_screen_at(cls, cursor_pos: QPoint) -> QScreen | None:
+        """Return the screen under the cursor, reusing the last placement screen.
+
+        Successive windows are usually opened from the same monitor, so one
+        geometry test replaces a ``screenAt`` scan over every screen.
+        """
+        screen = cls._last_placement_screen
+        if (
+            screen is not None
+            and not sip.isdeleted(screen)
+            and screen.geometry().contains(cursor_pos)
+        ):
+            return screen
+        screen = QGuiApplication.screenAt(cursor_pos)
+        if screen is None:
+            return QGuiApplication.primaryScreen()
+        cls._last_placement_screen = screen
+        return screen
 
     @classmethod
     def position_window_near_cursor(
@@ -200,9 +355,7 @@ class WindowManager:
         """Place window centered on mouse cursor without overlapping floating windows."""
         resolved_avoid_widgets = tuple(avoid_widgets)
         cursor_pos = QCursor.pos()
-        screen = QGuiApplication.screenAt(cursor_pos)
-        if screen is None:
-            screen = QGuiApplication.primaryScreen()
+        screen = cls._placement_screen_at(cursor_pos)
         if screen is None:
             return
 
@@ -213,99 +366,54 @@ class WindowManager:
         width = size.width()
         height = size.height()
 
-        bounds_left = available.left()
-        bounds_top = available.top()
-        bounds_right = bounds_left + available.width()
-        bounds_bottom = bounds_top + available.height()
-
-        base_x = cursor_pos.x() - (width // 2) + offset
-        base_y = cursor_pos.y() - (height // 2) + offset
-
-        def clamp(x: int, y: int) -> tuple[int, int]:
-            return (
-                min(max(x, bounds_left), bounds_right - width),
-                min(max(y, bounds_top), bounds_bottom - height),
-            )
-
-        avoid_rects = []
-        for widget in resolved_avoid_widgets:
-            try:
-                avoid_rects.append(widget.frameGeometry())
-            except RuntimeError:
-                continue
-
-        def intersects_any(rect: QRect) -> bool:
-            for widget in QApplication.topLevelWidgets():
-                if widget is window:
-                    continue
-                if not widget.isVisible():
-                    continue
-                if isinstance(widget, QMainWindow):
-                    continue
-                try:
-                    other = widget.frameGeometry()
-                except RuntimeError:
-                    continue
-                if rect.intersects(other):
-                    return True
-            for other in avoid_rects:
-                if rect.intersects(other):
-                    return True
-            return False
-
-        candidates: list[tuple[int, int]] = []
-        gap = 12
-        for avoid in avoid_rects:
-            if avoid.contains(cursor_pos):
-                candidates.extend(
-                    [
-                        (avoid.right() + gap, cursor_pos.y() - (height // 2)),
-                        (avoid.left() - width - gap, cursor_pos.y() - (height // 2)),
-                        (cursor_pos.x() - (width // 2), avoid.bottom() + gap),
-                        (cursor_pos.x() - (width // 2), avoid.top() - height - gap),
-                    ]
-                )
-                break
-
-        if len(candidates) == 0:
-            candidates.append((base_x, base_y))
+        # Reduce everything Qt-side to int tuples so the search itself is a
+        # pure, cacheable function of the placement inputs.
+        bounds = (
+            available.left(),
+            available.top(),
+            available.left() + available.width() - width,
+            available.top() + available.height() - height,
+        )
+        avoid_rects = tuple(
+            _inclusive_edges(widget.frameGeometry())
+            for widget in resolved_avoid_widgets
+            if not sip.isdeleted(widget)
+        )
 
-        step = 32
-        rings = 12
-        for r in range(1, rings + 1):
-            delta = r * step
-            candidates.extend(
-                [
-                    (base_x + delta, base_y),
-                    (base_x - delta, base_y),
-                    (base_x, base_y + delta),
-                    (base_x, base_y - delta),
-                    (base_x + delta, base_y + delta),
-                    (base_x + delta, base_y - delta),
-                    (base_x - delta, base_y + delta),
-                    (base_x - delta, base_y - delta),
-                ]
+        # Snapshot floating top-level geometry once; candidates are tested
+        # against this flat tuple instead of re-walking Qt per candidate.
+        obstacle_rects = [
+            _inclusive_edges(widget.frameGeometry())
+            for widget in QApplication.topLevelWidgets()
+            if widget is not window
+            and widget.isVisible()
+            and not isinstance(widget, QMainWindow)
+        ]
+        obstacle_rects.extend(avoid_rects)
+
+        window.move(
+            *_solve_window_position(
+                (cursor_pos.x(), cursor_pos.y()),
+                offset,
+                (width, height),
+                bounds,
+                tuple(rect for rect in obstacle_rects if rect is not None),
+                tuple(rect for rect in avoid_rects if rect is not None),
             )
-
-        for candidate_x, candidate_y in candidates:
-            x, y = clamp(candidate_x, candidate_y)
-            rect = QRect(x, y, width, height)
-            if not intersects_any(rect):
-                window.move(x, y)
-                return
-
-        x, y = clamp(base_x, base_y)
-        window.move(x, y)
+        )
 
     @classmethod
     def _focus_window(cls, window: QWidget, scope_id: str) -> None:
         """Show, raise, activate, and restore a registered window."""
+        # Un-minimize first so raise/activate act on a visible frame; clearing
+        # only the minimized bit keeps a maximized window maximized.
+        state = window.windowState()
+        if state & Qt.WindowState.WindowMinimized:
+            window.setWindowState(state & ~Qt.WindowState.WindowMinimized)
         if not window.isVisible():
             window.show()
 
-        app = QApplication.instance()
-        is_already_active = app is not None and app.activeWindow() == window
-        if is_already_active:
+        if QApplication.activeWindow() is window:
             logger.debug(
                 "[WINDOW_MGR] Window already active, skipping raise/activate: %s",
                 scope_id,
@@ -314,9 +422,6 @@ class WindowManager:
             window.raise_()
             window.activateWindow()
 
-        if window.isMinimized():
-            window.showNormal()
-
     @classmethod
     def show_or_focus(
         cls,
@@ -388,22 +493,10 @@ class WindowManager:
         # Create new window
         logger.debug(f"[WINDOW_MGR] Creating new window for scope: {scope_id}")
         window = window_factory()
-        cls._scoped_windows[scope_id] = window
-        if navigation_driver is None:
-            cls._navigation_drivers[scope_id] = NullWindowNavigationDriver()
-        else:
-            cls._navigation_drivers[scope_id] = navigation_driver
-        if code_document_driver is not None:
-            cls._code_document_drivers[scope_id] = code_document_driver
-
-        # Auto-cleanup on close (hook into closeEvent)
-        original_close = window.closeEvent
+        cls._store_entry(scope_id, window, navigation_driver, code_document_driver)
 
-        def close_wrapper(event):
-            cls.unregister(scope_id)
-            original_close(event)
-
-        window.closeEvent = close_wrapper
+        # Auto-cleanup on close
+        window.installEventFilter(_ScopeCloseWatcher(scope_id, window))
 
         # Show window
         window.show()
@@ -473,12 +566,13 @@ class WindowManager:
         # This ensures scroll/flash only happens after:
         # 1. Window is painted (QTimer.singleShot(0, ...))
         # 2. Target widgets exist (_on_build_complete_callbacks)
-        cls._deferred_navigate(
-            window,
-            item_id,
-            field_path,
-            cls._navigation_driver(scope_id),
-        )
+        if item_id is not None or field_path is not None:
+            cls._deferred_navigate(
+                window,
+                item_id,
+                field_path,
+                cls._navigation_driver(scope_id),
+            )
 
         return True
 
@@ -491,7 +585,8 @@ class WindowManager:
     ) -> bool:
         """Focus/navigate the registered scope that owns a concrete Qt window."""
         target_window = window.window()
-        for scope_id, registered_window in cls._scoped_windows.items():
+        for scope_id, entry in cls._scoped_windows.items():
+            registered_window = entry.window
             if registered_window is window or registered_window.window() is target_window:
                 return cls.focus_and_navigate(
                     scope_id,
@@ -517,21 +612,22 @@ class WindowManager:
         For nested field navigation (e.g., "well_filter_config.well_filter"),
         we check that nested managers exist at all path levels.
         """
-        driver = navigation_driver
-        if driver is None:
-            driver = NullWindowNavigationDriver()
         request = RegisteredWindowNavigationRequest(
             window=window,
             item_id=item_id,
             field_path=field_path,
         )
+        if not request.has_target:
+            # Pure focus: nothing to wait for, so don't arm a timer at all.
+            return
+        driver = navigation_driver
+        if driver is None:
+            driver = _NULL_NAVIGATION_DRIVER
 
         def _check_and_navigate():
             """Check if widgets are ready, navigate or schedule retry."""
-            try:
-                window.windowTitle()
-            except RuntimeError:
-                logger.debug(f"[WINDOW_MGR] Window deleted during deferred navigation")
+            if sip.isdeleted(window):
+                logger.debug("[WINDOW_MGR] Window deleted during deferred navigation")
                 return
 
             readiness = driver.readiness(request)
@@ -594,18 +690,11 @@ class WindowManager:
         if scope_id in cls._scoped_windows:
             logger.warning(f"[WINDOW_MGR] Overwriting existing window for scope: {scope_id}")
 
-        cls._scoped_windows[scope_id] = window
-        if navigation_driver is None:
-            cls._navigation_drivers[scope_id] = NullWindowNavigationDriver()
-        else:
-            cls._navigation_drivers[scope_id] = navigation_driver
-        if code_document_driver is not None:
-            cls._code_document_drivers[scope_id] = code_document_driver
+        cls._store_entry(scope_id, window, navigation_driver, code_document_driver)
 
         # Eagerly create flash overlay so OpenGL context is ready before any flashes
         # This prevents first-paint glitches when GL initializes mid-render
-        from pyqt_reactive.animation import WindowFlashOverlay
-        WindowFlashOverlay.get_for_window(window)
+        window_flash_overlay_type().get_for_window(window)
 
         logger.debug(f"[WINDOW_MGR] Registered window for scope: {scope_id}")
 
@@ -618,34 +707,41 @@ class WindowManager:
         Args:
             scope_id: Scope to unregister
         """
-        if scope_id in cls._scoped_windows:
-            from pyqt_reactive.animation import WindowFlashOverlay
+        entry = cls._scoped_windows.pop(scope_id, None)
+        if entry is None:
+            return
+        window_flash_overlay_type().cleanup_window(entry.window)
+        logger.debug(f"[WINDOW_MGR] Unregistered window: {scope_id}")
 
-            WindowFlashOverlay.cleanup_window(cls._scoped_windows[scope_id])
-            del cls._scoped_windows[scope_id]
-            if scope_id in cls._navigation_drivers:
-                del cls._navigation_drivers[scope_id]
-            if scope_id in cls._code_document_drivers:
-                del cls._code_document_drivers[scope_id]
-            logger.debug(f"[WINDOW_MGR] Unregistered window: {scope_id}")
+    @classmethod
+    def unregister_window(cls, scope_id: str, window: QObject) -> None:
+        """Unregister ``scope_id`` only while it is still bound to ``window``.
+
+        A closing window must not evict a newer window registered for the same
+        scope after it.
+        """
+        entry = cls._scoped_windows.get(scope_id)
+        if entry is not None and entry.window is window:
+            cls.unregister(scope_id)
 
     @classmethod
     def require_code_document_driver(cls, scope_id: str) -> "WindowCodeDocumentDriver":
         """Return the code-document driver explicitly registered for a scope."""
-        if scope_id not in cls._code_document_drivers:
+        entry = cls._scoped_windows.get(scope_id)
+        driver = None if entry is None else entry.code_document_driver
+        if driver is None:
             raise KeyError(
                 f"Window scope has no code-document driver registered: {scope_id!r}"
             )
-        return cls._code_document_drivers[scope_id]
+        return driver
 
     @classmethod
     def get_code_document_scopes(cls) -> list[str]:
         """Return open window scopes with registered code-document drivers."""
-        open_scopes = set(cls.get_open_scopes())
         return [
             scope_id
-            for scope_id in cls._code_document_drivers
-            if scope_id in open_scopes
+            for scope_id in cls.get_open_scopes()
+            if cls._scoped_windows[scope_id].code_document_driver is not None
         ]
 
     @classmethod
@@ -703,22 +799,13 @@ class WindowManager:
             List of scope_ids for open windows
         """
         valid_scopes = []
-        stale_scopes = []
 
-        for scope_id, window in cls._scoped_windows.items():
-            try:
-                window.isVisible()
+        # Iterate a snapshot so stale entries can be dropped in the same pass.
+        for scope_id, entry in tuple(cls._scoped_windows.items()):
+            if not sip.isdeleted(entry.window):
                 valid_scopes.append(scope_id)
-            except RuntimeError:
-                stale_scopes.append(scope_id)
-
-        # Cleanup stale references
-        for scope_id in stale_scopes:
+                continue
             del cls._scoped_windows[scope_id]
-            if scope_id in cls._navigation_drivers:
-                del cls._navigation_drivers[scope_id]
-            if scope_id in cls._code_document_drivers:
-                del cls._code_document_drivers[scope_id]
             logger.debug(f"[WINDOW_MGR] Cleaned up stale reference: {scope_id}")
 
         return valid_scopes
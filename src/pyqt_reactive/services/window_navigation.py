@@ -4,12 +4,25 @@ from __future__ import annotations
 
 from abc import ABC
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
+from typing import TYPE_CHECKING
 
 from objectstate import ObjectState
 from PyQt6.QtWidgets import QWidget
 
+if TYPE_CHECKING:
+    from pyqt_reactive.animation import WindowFlashOverlay
+
+
+@cache
+def window_flash_overlay_type() -> type[WindowFlashOverlay]:
+    """Import the (heavy, OpenGL-backed) flash overlay once, on first use."""
+    from pyqt_reactive.animation import WindowFlashOverlay
+
+    return WindowFlashOverlay
+
 
 @dataclass(frozen=True, slots=True)
 class WindowNavigationRequest:
@@ -58,6 +71,12 @@ class RegisteredWindowNavigationRequest:
     window: QWidget
     item_id: str | None = None
     field_path: str | None = None
+    # Split once per request; readiness is re-checked on every navigation retry.
+    field_path_parts: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        parts = () if self.field_path is None else tuple(self.field_path.split("."))
+        object.__setattr__(self, "field_path_parts", parts)
 
     @property
     def has_target(self) -> bool:
@@ -134,9 +153,7 @@ class FieldWindowNavigationDriver(WindowNavigationDriver):
         if request.field_path is None:
             return
 
-        from pyqt_reactive.animation import WindowFlashOverlay
-
-        WindowFlashOverlay.get_for_window(request.window)
+        window_flash_overlay_type().get_for_window(request.window)
         self._select_field(request.field_path)
 
 
@@ -167,9 +184,9 @@ class FormFieldWindowNavigationDriver(FieldWindowNavigationDriver):
             return RegisteredWindowNavigationReadiness(
                 wait_reason=NavigationWaitReason.ROOT_WIDGETS,
             )
-        if "." in request.field_path and not self._nested_manager_exists(
+        if len(request.field_path_parts) > 1 and not self._nested_manager_exists(
             form_manager,
-            request.field_path,
+            request.field_path_parts,
         ):
             return RegisteredWindowNavigationReadiness(
                 wait_reason=NavigationWaitReason.NESTED_MANAGER,
@@ -185,10 +202,9 @@ class FormFieldWindowNavigationDriver(FieldWindowNavigationDriver):
     @staticmethod
     def _nested_manager_exists(
         form_manager: FormNavigationManager,
-        field_path: str,
+        path_parts: tuple[str, ...],
     ) -> bool:
         current_manager = form_manager
-        path_parts = field_path.split(".")
 
         for part in path_parts[:-1]:
             if part not in current_manager.nested_managers:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import ClassVar
 
 from metaclass_registry import AutoRegisterMeta
@@ -58,6 +58,22 @@ class ExecutionServerInfo(BaseServerInfo):
 
     _server_role = ServerRole.EXECUTION
 
+    # Id projections are derived once; the frozen response never changes.
+    running_executions: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    queued_executions: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "running_executions",
+            tuple(entry.execution_id for entry in self.running_execution_entries),
+        )
+        object.__setattr__(
+            self,
+            "queued_executions",
+            tuple(entry.execution_id for entry in self.queued_execution_entries),
+        )
+
     @property
     def workers(self) -> tuple[WorkerState, ...]:
         return self.response.workers or ()
@@ -70,14 +86,6 @@ class ExecutionServerInfo(BaseServerInfo):
     def queued_execution_entries(self) -> tuple[QueuedExecutionInfo, ...]:
         return self.response.queued_executions or ()
 
-    @property
-    def running_executions(self) -> tuple[str, ...]:
-        return tuple(entry.execution_id for entry in self.running_execution_entries)
-
-    @property
-    def queued_executions(self) -> tuple[str, ...]:
-        return tuple(entry.execution_id for entry in self.queued_execution_entries)
-
 
 @dataclass(frozen=True, slots=True)
 class ViewerServerInfo(BaseServerInfo):
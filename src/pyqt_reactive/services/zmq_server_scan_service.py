@@ -27,18 +27,43 @@ class ZMQServerScanService:
         self.transport_mode = resolve_transport_mode(transport_mode)
         self.timeout_ms = timeout_ms
         self.max_workers = max_workers
+        # Reused across scans; worker threads start on first submit and stay
+        # parked between periodic scans until close().
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="zmq-server-scan",
+        )
+        self._closed = False
+
+    def close(self) -> None:
+        """Shut down the scan worker threads; later scans raise ``RuntimeError``."""
+
+        self._closed = True
+        # Owners close from the GUI thread; an in-flight ping finishes on its
+        # own timeout instead of blocking the caller.
+        self._executor.shutdown(wait=False)
 
     def scan_ports(self, ports: Sequence[int]) -> list[PongResponse]:
         """Ping all provided ports in parallel."""
 
-        responses: list[PongResponse] = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = tuple(executor.submit(self.ping_server, port) for port in ports)
-            for future in concurrent.futures.as_completed(futures):
-                response = future.result()
-                if response is not None:
-                    responses.append(response)
-        return responses
+        if self._closed:
+            raise RuntimeError("Cannot scan ports after the scan service is closed")
+
+        ports = tuple(ports)
+        if len(ports) <= 1:
+            # No parallelism to gain; skip the executor's thread start-up.
+            return [
+                response
+                for response in map(self.ping_server, ports)
+                if response is not None
+            ]
+
+        # Results come back in port order; no completion set to maintain.
+        return [
+            response
+            for response in self._executor.map(self.ping_server, ports)
+            if response is not None
+        ]
 
     def ping_server(self, port: int) -> PongResponse | None:
         """Return the authoritative typed heartbeat for one server."""
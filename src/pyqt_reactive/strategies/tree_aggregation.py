@@ -31,7 +31,7 @@ class ExplicitPercentTreeAggregationPolicy(TreeAggregationPolicyABC):
         return node_percent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TreeAggregationPolicyRegistry:
     """Typed policy registry with fail-loud lookups."""
 
@@ -43,6 +43,7 @@ class TreeAggregationPolicyRegistry:
         node_percent: float,
         children: Sequence[float],
     ) -> float:
-        if policy_id not in self.policies:
+        policy = self.policies.get(policy_id)
+        if policy is None:
             raise ValueError(f"Unknown tree aggregation policy '{policy_id}'")
-        return self.policies[policy_id].aggregate(node_percent, children)
+        return policy.aggregate(node_percent, children)
@@ -8,7 +8,7 @@ JSON configuration, and WCAG accessibility compliance.
 
 import logging
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Self, Tuple
 
@@ -20,6 +20,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _rgb_hex(r: int, g: int, b: int) -> str:
+    """Format one RGB triple as a hex string; schemes reuse a small palette."""
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
 @dataclass
 class ColorScheme:
     """
@@ -183,7 +189,7 @@ class ColorScheme:
             str: Hex color string (e.g., "#ff0000")
         """
         r, g, b = color_tuple
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return _rgb_hex(r, g, b)
 
     @classmethod
     def create_dark_theme(cls) -> Self:
@@ -15,6 +15,17 @@ from PyQt6.QtCore import QObject, QEvent, Qt
 from weakref import WeakKeyDictionary
 import math
 
+# Bound once: the filter runs for every application event, and each
+# QEvent.Type / Qt.KeyboardModifier access is a chain of attribute lookups.
+_WHEEL_EVENT = QEvent.Type.Wheel
+_PARENT_CHANGE_EVENT = QEvent.Type.ParentChange
+_SHIFT_MODIFIER = Qt.KeyboardModifier.ShiftModifier
+
+# Wheel delta units per fractional step (larger = less sensitive), as a
+# reciprocal so each event multiplies instead of divides.
+_WHEEL_DELTA_PER_STEP = 240.0
+_STEPS_PER_WHEEL_DELTA = 1.0 / _WHEEL_DELTA_PER_STEP
+
 
 class ShiftWheelHorizontalScrollFilter(QObject):
     """Global event filter that enables Shift+Wheel horizontal scrolling.
@@ -40,6 +51,12 @@ class ShiftWheelHorizontalScrollFilter(QObject):
         # Accumulators store fractional scroll amounts per-horizontal-scrollbar
         # so small wheel movements produce smooth scrolling once accumulated.
         self._accumulators: "WeakKeyDictionary[object, float]" = WeakKeyDictionary()
+        # Nearest QAbstractScrollArea ancestor (or None) per event receiver.
+        # Any ParentChange in the application can move a subtree, so the
+        # whole cache is dropped then instead of tracking descendants.
+        self._scroll_area_cache: "WeakKeyDictionary[QObject, QAbstractScrollArea | None]" = (
+            WeakKeyDictionary()
+        )
 
     def eventFilter(self, a0, a1):
         """Filter wheel events for horizontal scrolling.
@@ -51,60 +68,76 @@ class ShiftWheelHorizontalScrollFilter(QObject):
         Returns:
             True if the event was handled, False to pass it through
         """
-        if a1.type() == QEvent.Type.Wheel:
-            # Check if Shift is pressed
-            if a1.modifiers() & Qt.KeyboardModifier.ShiftModifier:
-                # Find the scroll area this event belongs to
-                scroll_area = None
-                parent = a0
-                while parent is not None:
-                    if isinstance(parent, QAbstractScrollArea):
-                        scroll_area = parent
-                        break
-                    parent = parent.parent()
-
-                if scroll_area is not None:
-                    h_scrollbar = scroll_area.horizontalScrollBar()
-                    if h_scrollbar is not None and h_scrollbar.isVisible():
-                        delta = a1.angleDelta().y()
-                        if delta != 0:
-                            # Use singleStep as base; fall back to 1 if it's 0
-                            base_step = h_scrollbar.singleStep() or 1
-                            step_float = base_step * self._multiplier
-
-                            # Convert wheel delta to fractional steps (larger denominator = less sensitive)
-                            delta_steps_float = float(delta) / 240.0
-
-                            # Desired movement (may be fractional)
-                            movement = delta_steps_float * step_float
-
-                            # Accumulate fractional movement for this scrollbar
-                            acc = self._accumulators.get(h_scrollbar, 0.0) + movement
-
-                            # Determine integer movement to apply now using truncation toward zero
-                            # (requires |acc| >= 1.0 before any movement occurs)
-                            apply_steps = int(acc)
-                            if apply_steps != 0:
-                                new_value = h_scrollbar.value() - apply_steps
-                                h_scrollbar.setValue(int(new_value))
-                                # Remove applied integer part from accumulator
-                                acc -= apply_steps
-
-                            # Store back accumulator (keep fractional remainder)
-                            # Clamp accumulator to a reasonable range to avoid runaway
-                            max_acc = step_float * 20
-                            if acc > max_acc:
-                                acc = max_acc
-                            elif acc < -max_acc:
-                                acc = -max_acc
-
-                            self._accumulators[h_scrollbar] = acc
-                            a1.accept()
-                            return True
+        event_type = a1.type()
+        if event_type != _WHEEL_EVENT:
+            # Every application event passes through here; QObject's own
+            # eventFilter is a no-op, so non-wheel events return directly.
+            if event_type == _PARENT_CHANGE_EVENT:
+                self._scroll_area_cache.clear()
+            return False
+
+        # Check if Shift is pressed
+        if a1.modifiers() & _SHIFT_MODIFIER:
+            # Find the scroll area this event belongs to
+            scroll_area = self._nearest_scroll_area(a0)
+
+            if scroll_area is not None:
+                h_scrollbar = scroll_area.horizontalScrollBar()
+                if h_scrollbar is not None and h_scrollbar.isVisible():
+                    delta = a1.angleDelta().y()
+                    if delta != 0:
+                        # Use singleStep as base; fall back to 1 if it's 0
+                        base_step = h_scrollbar.singleStep() or 1
+                        step_float = base_step * self._multiplier
+
+                        # Desired movement (may be fractional)
+                        movement = delta * _STEPS_PER_WHEEL_DELTA * step_float
+
+                        # Accumulate fractional movement for this scrollbar
+                        acc = self._accumulators.get(h_scrollbar, 0.0) + movement
+
+                        # Determine integer movement to apply now using truncation toward zero
+                        # (requires |acc| >= 1.0 before any movement occurs)
+                        apply_steps = int(acc)
+                        if apply_steps != 0:
+                            new_value = h_scrollbar.value() - apply_steps
+                            h_scrollbar.setValue(int(new_value))
+                            # Remove applied integer part from accumulator
+                            acc -= apply_steps
+
+                        # Store back accumulator (keep fractional remainder)
+                        # Clamp accumulator to a reasonable range to avoid runaway
+                        max_acc = step_float * 20
+                        if acc > max_acc:
+                            acc = max_acc
+                        elif acc < -max_acc:
+                            acc = -max_acc
+
+                        self._accumulators[h_scrollbar] = acc
+                        a1.accept()
+                        return True
         
         # Pass event through to next filter
         return super().eventFilter(a0, a1)
 
+    def _nearest_scroll_area(self, obj: QObject) -> "QAbstractScrollArea | None":
+        """Return the closest QAbstractScrollArea at or above ``obj``, cached."""
+        try:
+            return self._scroll_area_cache[obj]
+        except KeyError:
+            pass
+
+        scroll_area = None
+        parent = obj
+        while parent is not None:
+            if isinstance(parent, QAbstractScrollArea):
+                scroll_area = parent
+                break
+            parent = parent.parent()
+
+        self._scroll_area_cache[obj] = scroll_area
+        return scroll_area
+
 
 def install_shift_wheel_scrolling(app, scroll_speed_multiplier: float = 0.01) -> ShiftWheelHorizontalScrollFilter:
     """Install global Shift+Wheel horizontal scrolling for the application.
@@ -7,14 +7,15 @@ Displays a scrollable list of function panes with Add/Load/Save/Code controls.
 
 import logging
 import os
-import copy
 from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import List, Union, Dict, Optional, Any, Callable
 
+from PyQt6 import sip
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QScrollArea
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 
 from pyqt_reactive.protocols import (
     get_function_registry,
@@ -36,11 +37,11 @@ from pyqt_reactive.services.function_pattern_code_document import (
     FunctionPatternList,
     FunctionPatternValue,
     PatternTokens,
-    TokenizedFunctionEntry,
 )
 from python_introspect import SignatureAnalyzer
 from pyqt_reactive.widgets.function_pane import FunctionPaneWidget
-from objectstate import ObjectStateRegistry
+from objectstate import ObjectStateRegistry, patch_lazy_constructors
+from pyqt_reactive.animation import WindowFlashOverlay
 from pyqt_reactive.theming import ColorScheme, WidgetTheme
 from pyqt_reactive.forms.layout_constants import CURRENT_LAYOUT
 from pyqt_reactive.forms.ui_utils import format_enum_display
@@ -49,10 +50,49 @@ from pyqt_reactive.widgets.shared.detachable_action_bar import (
     DetachableActionBarHost,
 )
 from pyqt_reactive.widgets.shared.scope_visual_config import ScopeColorScheme
+from pyqt_reactive.widgets.shared.clickable_help_components import (
+    GroupBoxWithHelp,
+    HelpButton,
+    HelpIndicator,
+)
+from pyqt_reactive.widgets.shared.scope_color_utils import tint_color_perceptual
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _cached_signature(func: FunctionAuthority) -> Dict[str, Any]:
+    return SignatureAnalyzer.analyze(func)
+
+
+def _function_signature(func: FunctionAuthority) -> Dict[str, Any]:
+    """Return SignatureAnalyzer parameter info for ``func``, memoized per callable.
+
+    Pattern reads re-prune kwargs for the same handful of functions, so the
+    signature/docstring introspection is done once per callable. The shared
+    result must be treated as read-only.
+    """
+    try:
+        return _cached_signature(func)
+    except TypeError:
+        # Unhashable callable instances are analyzed without caching.
+        return SignatureAnalyzer.analyze(func)
+
+
+def _prune_default_kwargs(func: FunctionAuthority, kwargs: FunctionKwargs) -> FunctionKwargs:
+    """Drop kwargs that are None or equal to ``func``'s signature default."""
+    param_info = _function_signature(func) if func else {}
+    pruned: FunctionKwargs = {}
+    for key, value in kwargs.items():
+        if value is None:
+            continue
+        default_info = param_info.get(key)
+        if default_info is not None and value == default_info.default_value:
+            continue
+        pruned[key] = value
+    return pruned
+
+
 @dataclass(frozen=True)
 class PatternMutation:
     """One function-pattern mutation plus its synchronization policy."""
@@ -94,6 +134,9 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
     # No ObjectState - this widget manages data through function panes, not ParameterFormManager
     state = None
 
+    # PatternDataManager is stateless (static methods only); one shared instance.
+    data_manager = PatternDataManager()
+
     @property
     def pattern_code_documents(self) -> FunctionPatternCodeDocumentService:
         """Document service for function-pattern code and token operations."""
@@ -151,6 +194,9 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         self._pattern_tokens: Union[List[str], Dict[str, List[str]]] = []
         # Tokens aligned with self.functions for currently visible view.
         self._current_function_tokens: List[str] = []
+        # Button state last applied by a no-op key re-select; any other
+        # button refresh clears it so re-selects never trust a stale value.
+        self._last_nav_signature: Optional[tuple] = None
 
         # Component selection cache per GroupBy (mirrors Textual TUI)
         self.component_selections = {}
@@ -160,28 +206,27 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
             object_name="func_action_buttons_container"
         )
 
-        add_btn = QPushButton("Add")
-        add_btn.setMaximumWidth(60)
-        add_btn.setFixedHeight(CURRENT_LAYOUT.button_height)
-        add_btn.setStyleSheet(self._get_button_style())
-        add_btn.clicked.connect(self.add_function)
-        self._action_buttons_container.add_button(add_btn)
+        # All action buttons share one stylesheet and height; build them once.
+        button_style_sheet = self._get_button_style()
+        button_height = CURRENT_LAYOUT.button_height
+
+        def add_action_button(text: str, max_width: int, slot) -> QPushButton:
+            button = QPushButton(text)
+            button.setMaximumWidth(max_width)
+            button.setFixedHeight(button_height)
+            button.setStyleSheet(button_style_sheet)
+            button.clicked.connect(slot)
+            self._action_buttons_container.add_button(button)
+            return button
 
-        code_btn = QPushButton("Code")
-        code_btn.setMaximumWidth(60)
-        code_btn.setFixedHeight(CURRENT_LAYOUT.button_height)
-        code_btn.setStyleSheet(self._get_button_style())
-        code_btn.clicked.connect(self.edit_function_code)
-        self._action_buttons_container.add_button(code_btn)
+        add_action_button("Add", 60, self.add_function)
+        add_action_button("Code", 60, self.edit_function_code)
 
         # Component selection button
-        self.component_btn = QPushButton(self._get_component_button_text())
-        self.component_btn.setMaximumWidth(120)
-        self.component_btn.setFixedHeight(CURRENT_LAYOUT.button_height)
-        self.component_btn.setStyleSheet(self._get_button_style())
-        self.component_btn.clicked.connect(self.show_component_selection_dialog)
+        self.component_btn = add_action_button(
+            self._get_component_button_text(), 120, self.show_component_selection_dialog
+        )
         self.component_btn.setEnabled(not self._is_component_button_disabled())
-        self._action_buttons_container.add_button(self.component_btn)
 
         # Channel navigation buttons.
         #
@@ -189,19 +234,8 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         # switch between dict keys/components. When render_header=False (DualEditorWindow
         # embeds the action buttons container in its own header), the nav buttons
         # must still exist and be clickable.
-        self.prev_key_btn = QPushButton("<")
-        self.prev_key_btn.setMaximumWidth(30)
-        self.prev_key_btn.setFixedHeight(CURRENT_LAYOUT.button_height)
-        self.prev_key_btn.setStyleSheet(self._get_button_style())
-        self.prev_key_btn.clicked.connect(lambda: self._navigate_pattern_key(-1))
-        self._action_buttons_container.add_button(self.prev_key_btn)
-
-        self.next_key_btn = QPushButton(">")
-        self.next_key_btn.setMaximumWidth(30)
-        self.next_key_btn.setFixedHeight(CURRENT_LAYOUT.button_height)
-        self.next_key_btn.setStyleSheet(self._get_button_style())
-        self.next_key_btn.clicked.connect(lambda: self._navigate_pattern_key(1))
-        self._action_buttons_container.add_button(self.next_key_btn)
+        self.prev_key_btn = add_action_button("<", 30, self._on_prev_key_clicked)
+        self.next_key_btn = add_action_button(">", 30, self._on_next_key_clicked)
 
         # Initialize services (reuse existing business logic)
         self.function_registry = get_function_registry()
@@ -216,7 +250,6 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
                 "No function selection provider registered. Call register_function_selection_provider(...)."
             )
         self._groupby_enum = self.component_selection_provider.get_groupby_enum()
-        self.data_manager = PatternDataManager()
         self.pattern_code_documents = FunctionPatternCodeDocumentService()
         self.service_adapter = service_adapter
 
@@ -232,6 +265,8 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
 
         # Scope color scheme for styling newly created panes
         self._scope_color_scheme: ScopeColorScheme | None = None
+        # Set while one deferred child-styling pass is queued for async form builds.
+        self._scope_styling_pending = False
 
         # Initialize pattern data and mode
         self._initialize_pattern_data(initial_functions)
@@ -258,13 +293,14 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
 
         def _is_relevant_time_travel(dirty_states) -> bool:
             scope = str(self.scope_id)
+            scope_prefix = scope + "::"
             for entry in dirty_states or []:
                 if not isinstance(entry, (tuple, list)) or len(entry) < 1:
                     continue
                 scope_id = entry[0]
                 if not isinstance(scope_id, str) or not scope_id:
                     continue
-                if scope_id == scope or scope_id.startswith(scope + "::"):
+                if scope_id == scope or scope_id.startswith(scope_prefix):
                     return True
             return False
 
@@ -283,14 +319,15 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
                 if _is_relevant_time_travel(dirty_states):
                     self._refresh_pattern_from_context_state()
 
-                from PyQt6 import sip
-
-                for pane in list(self.function_panes):
-                    if sip.isdeleted(pane):
-                        continue
-                    fm = pane.form_manager
-                    if fm is not None:
-                        fm.refresh_widgets_from_state()
+                # dirty_states only lists scopes that need navigation, so it
+                # cannot be used to skip panes; repaint once for all of them.
+                with self._batched_pane_updates():
+                    for pane in list(self.function_panes):
+                        if sip.isdeleted(pane):
+                            continue
+                        fm = pane.form_manager
+                        if fm is not None:
+                            fm.refresh_widgets_from_state()
 
                 # Re-apply current pattern so kwargs are pushed to panes
                 self.refresh_from_context()
@@ -382,26 +419,24 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         state = self._get_context_state()
         if state is None:
             return
-        state.metadata[FUNC_EDITOR_PATTERN_TOKENS_META_KEY] = copy.deepcopy(self._pattern_tokens)
+        # Tokens are immutable strings, so copying the containers is enough.
+        tokens = self._pattern_tokens
+        if isinstance(tokens, dict):
+            persisted = {key: list(view_tokens) for key, view_tokens in tokens.items()}
+        else:
+            persisted = list(tokens)
+        state.metadata[FUNC_EDITOR_PATTERN_TOKENS_META_KEY] = persisted
 
     @staticmethod
     def _sanitize_pattern_kwargs(kwargs: dict | None) -> FunctionKwargs:
         """Validate kwargs and reject internal scope-token metadata."""
         return FunctionPatternCodeDocumentService.sanitize_pattern_kwargs(kwargs)
 
-    def _get_tokens_for_current_view(self) -> List[str]:
-        if self.is_dict_mode and isinstance(self._pattern_tokens, dict):
-            key = str(self.selected_pattern_key) if self.selected_pattern_key is not None else ""
-            return list(self._pattern_tokens.get(key, []))
-        if isinstance(self._pattern_tokens, list):
-            return list(self._pattern_tokens)
-        return []
-
     def _set_tokens_for_current_view(self, tokens: List[str]) -> None:
         normalized = [str(token) for token in tokens if token]
         if self.is_dict_mode:
-            if not isinstance(self._pattern_tokens, dict):
-                self._pattern_tokens = {}
+            # Every path that enters dict mode installs dict tokens with it
+            # (_initialize_pattern_data, _update_components).
             key = str(self.selected_pattern_key) if self.selected_pattern_key is not None else ""
             self._pattern_tokens[key] = normalized
         else:
@@ -423,8 +458,17 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         if self.selected_pattern_key == key:
             if persist_selection:
                 self._record_selected_pattern_key()
-            self._refresh_component_button()
-            self._update_navigation_buttons()
+            nav_signature = (
+                self.is_dict_mode,
+                self.selected_pattern_key,
+                self._get_component_button_text(),
+                self._is_component_button_disabled(),
+                len(self.pattern_data),
+            )
+            if nav_signature != self._last_nav_signature:
+                self._refresh_component_button()
+                self._update_navigation_buttons()
+                self._last_nav_signature = nav_signature
             return
 
         if commit_current_view:
@@ -470,7 +514,7 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
 
         # Capture existing panes by token so we can reorder without destroying widgets.
         pane_by_token: dict[str, Any] = {}
-        for pane in list(self.function_panes):
+        for pane in self.function_panes:
             token = pane.func_scope_token
             if token:
                 pane_by_token[str(token)] = pane
@@ -530,32 +574,43 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
                 break
             expected_func_by_token[token] = func
 
-        from PyQt6 import sip
-
-        can_reorder = (
-            self.function_panes
-            and all(not sip.isdeleted(p) for p in self.function_panes)
-            and len(new_tokens) == len(self.function_panes)
-            and len(set(new_tokens)) == len(new_tokens)
-            and len(pane_by_token) == len(self.function_panes)
-            and all(not sip.isdeleted(p) for p in pane_by_token.values())
-            and set(new_tokens) == set(pane_by_token.keys())
+        # Equal sizes of the three maps mean tokens are unique on both sides, so
+        # one pass that finds every new token on a live pane with the same
+        # function proves the panes are exactly a permutation of the pattern.
+        can_reorder = bool(self.function_panes) and (
+            len(new_tokens)
+            == len(expected_func_by_token)
+            == len(pane_by_token)
+            == len(self.function_panes)
         )
+        reordered_panes = []
         if can_reorder:
             for token in new_tokens:
                 pane = pane_by_token.get(token)
-                if pane is None or pane.func is not expected_func_by_token.get(token):
+                if (
+                    pane is None
+                    or sip.isdeleted(pane)
+                    or pane.func is not expected_func_by_token[token]
+                ):
                     can_reorder = False
                     break
+                reordered_panes.append(pane)
 
         if can_reorder:
-            self.function_panes = [pane_by_token[t] for t in new_tokens]
-            for i, pane in enumerate(self.function_panes):
-                pane.index = i
-
-            # Reorder widgets in layout without recreating them.
-            for i, pane in enumerate(self.function_panes):
-                self.function_layout.insertWidget(i, pane)
+            # Same panes in the same order (e.g. a kwargs-only restore): indices
+            # and layout positions are already correct.
+            if any(
+                pane is not current
+                for pane, current in zip(reordered_panes, self.function_panes)
+            ):
+                self.function_panes = reordered_panes
+                for i, pane in enumerate(self.function_panes):
+                    pane.index = i
+
+                # Reorder widgets in layout without recreating them.
+                with self._batched_pane_updates():
+                    for i, pane in enumerate(self.function_panes):
+                        self.function_layout.insertWidget(i, pane)
         else:
             # Fallback for add/remove/replace: rebuild panes.
             self._populate_function_list()
@@ -636,37 +691,38 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
             normalized_dict = {}
             normalized_tokens: Dict[str, List[str]] = {}
             existing_tokens = self._pattern_tokens if isinstance(self._pattern_tokens, dict) else {}
+            first_key: Optional[str] = None
             for key, value in initial_functions.items():
                 str_key = str(key)
-                seed_tokens = existing_tokens.get(str_key, [])
+                if first_key is None:
+                    first_key = str_key
+                if not value:
+                    # Nothing to normalize or match against registered states.
+                    normalized_dict[str_key] = []
+                    normalized_tokens[str_key] = []
+                    continue
                 seed_tokens = self._canonical_function_scope_tokens(
                     value,
                     str_key,
-                    seed_tokens,
+                    existing_tokens.get(str_key, []),
                 )
-                normalized_list, channel_tokens = (
+                normalized_dict[str_key], normalized_tokens[str_key] = (
                     self._normalize_function_list(
                         value,
                         seen_tokens=seen_tokens,
                         seed_tokens=seed_tokens,
                     )
-                    if value
-                    else ([], [])
                 )
-                normalized_dict[str_key] = normalized_list
-                normalized_tokens[str_key] = channel_tokens
 
             self.pattern_data = normalized_dict
             self._pattern_tokens = normalized_tokens
             self.is_dict_mode = True
 
             # Set selected channel to first key and load its functions
-            if normalized_dict:
-                self.selected_pattern_key = next(iter(normalized_dict.keys()))
-                self.functions = normalized_dict[self.selected_pattern_key]
-                self._current_function_tokens = list(
-                    normalized_tokens.get(self.selected_pattern_key, [])
-                )
+            if first_key is not None:
+                self.selected_pattern_key = first_key
+                self.functions = normalized_dict[first_key]
+                self._current_function_tokens = list(normalized_tokens[first_key])
             else:
                 self.selected_pattern_key = None
                 self.functions = []
@@ -798,13 +854,15 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
                 token,
             )
 
-    @staticmethod
-    def _iter_tokenized_entries(
+    def _function_values_by_token(
+        self,
         pattern: FunctionPatternList | FunctionPatternByKey,
         tokens: PatternTokens,
-    ) -> list[TokenizedFunctionEntry]:
-        """Return flat (func, kwargs, token) entries from pattern + sidecar token map."""
-        return FunctionPatternCodeDocumentService.iter_tokenized_entries(
+    ) -> dict[str, FunctionPatternValue]:
+        """Index pattern entries by sidecar token (empty without a scope to update)."""
+        if not self.scope_id:
+            return {}
+        return FunctionPatternCodeDocumentService.function_values_by_token(
             pattern,
             tokens,
         )
@@ -876,6 +934,13 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
             }}
         """)
 
+        # The theme is fixed for the widget's lifetime; the empty-state label is
+        # recreated on every empty repopulate, so build its stylesheet once.
+        self._empty_state_style_sheet = (
+            f"color: {self.theme.scheme.to_hex(self.theme.scheme.text_disabled)}; "
+            "font-style: italic; padding: 20px;"
+        )
+
         # Function list container
         self.function_container = QWidget()
         self.function_layout = QVBoxLayout(self.function_container)
@@ -929,8 +994,6 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
             self.scroll_area.verticalScrollBar().setValue(0)
 
         # Invalidate flash overlay geometry cache after programmatic scroll.
-        from pyqt_reactive.animation import WindowFlashOverlay
-
         WindowFlashOverlay.invalidate_cache_for_widget(self)  # type: ignore[arg-type]
 
     def _get_button_style(self) -> str:
@@ -962,7 +1025,7 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
 
         if self.invocation_badge_provider is None:
             return None
-        func, _kwargs = self.data_manager.extract_func_and_kwargs(func_item)
+        func, _kwargs = PatternDataManager.extract_func_and_kwargs(func_item)
         if func is None:
             return None
         group_key = (
@@ -972,8 +1035,36 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         )
         return self.invocation_badge_provider(group_key, index, func)
 
+    @contextmanager
+    def _batched_pane_updates(self):
+        """Hold container repaints and relayouts until a batch of pane edits finishes.
+
+        Nested batches are no-ops; the outermost one re-enables the layout and
+        updates, which schedules a single relayout and repaint of the final panes.
+        """
+        container = self.function_container
+        if not container.updatesEnabled():
+            yield
+            return
+        layout = container.layout()
+        container.setUpdatesEnabled(False)
+        if layout is not None:
+            layout.setEnabled(False)
+        try:
+            yield
+        finally:
+            if layout is not None:
+                layout.setEnabled(True)
+                layout.invalidate()
+            container.setUpdatesEnabled(True)
+            container.updateGeometry()
+
     def _populate_function_list(self):
         """Populate function list with panes (mirrors Textual TUI)."""
+        with self._batched_pane_updates():
+            self._rebuild_function_panes()
+
+    def _rebuild_function_panes(self) -> None:
         # NOTE: We do NOT destroy function ObjectStates or clear scope tokens here.
         # - For code mode: _update_function_object_states() updates existing ObjectStates
         #   with new kwargs BEFORE this method is called, preserving dirty detection.
@@ -983,16 +1074,39 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         # - Scope tokens must persist so build_scope_id returns the same scope_id for
         #   the same function object, allowing ObjectState lookup to succeed.
 
-        # Clear existing widgets.
+        func_scope_prefix = self._get_current_function_state_parent_scope()
+
+        # Every function needs a token before panes can be matched to it.
+        missing = len(self.functions) - len(self._current_function_tokens)
+        if missing > 0:
+            self._current_function_tokens.extend(
+                self.pattern_code_documents.ensure_token() for _ in range(missing)
+            )
+            self._set_tokens_for_current_view(self._current_function_tokens)
+            self._persist_pattern_tokens_to_state()
+
+        # Reconcile by token: a pane still showing the same function on the same
+        # live ObjectState is moved instead of rebuilt.
+        reusable_by_token: dict[str, FunctionPaneWidget] = {}
+        for pane in self.function_panes:
+            if self._is_pane_reusable(pane, func_scope_prefix):
+                reusable_by_token[pane.func_scope_token] = pane
+        planned_panes: list[Optional[FunctionPaneWidget]] = []
+        for i, func_item in enumerate(self.functions):
+            pane = reusable_by_token.pop(self._current_function_tokens[i], None)
+            func, _kwargs = PatternDataManager.extract_func_and_kwargs(func_item)
+            planned_panes.append(pane if pane is not None and pane.func is func else None)
+        kept_panes = {id(pane) for pane in planned_panes if pane is not None}
+
+        # Detach existing widgets, deleting everything that is not reused.
         # IMPORTANT: Only delete via the layout traversal to avoid double-deleting
         # the same FunctionPaneWidget (which crashes with "wrapped C/C++ object ... deleted").
-        from PyQt6 import sip
-
+        # Take items from the end: one count() call and no item-list shifting.
         self.function_panes.clear()
-        while self.function_layout.count():
-            child = self.function_layout.takeAt(0)
+        for item_index in reversed(range(self.function_layout.count())):
+            child = self.function_layout.takeAt(item_index)
             widget = child.widget()
-            if widget is None or sip.isdeleted(widget):
+            if widget is None or sip.isdeleted(widget) or id(widget) in kept_panes:
                 continue
 
             # Unregister form manager if it exists
@@ -1001,24 +1115,25 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
 
             widget.deleteLater()  # Schedule for deletion instead of just orphaning
 
-        func_scope_prefix = self._get_current_function_state_parent_scope()
-
+        created_panes: list[FunctionPaneWidget] = []
         if not self.functions:
             # Show empty state
             empty_label = QLabel("No functions defined. Click 'Add' to begin.")
             empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_label.setStyleSheet(
-                f"color: {self.theme.scheme.to_hex(self.theme.scheme.text_disabled)}; "
-                "font-style: italic; padding: 20px;"
-            )
+            empty_label.setStyleSheet(self._empty_state_style_sheet)
             self.function_layout.addWidget(empty_label)
         else:
             # Create function panes
             for i, func_item in enumerate(self.functions):
-                if i >= len(self._current_function_tokens):
-                    self._current_function_tokens.append(self.pattern_code_documents.ensure_token())
-                    self._set_tokens_for_current_view(self._current_function_tokens)
-                    self._persist_pattern_tokens_to_state()
+                pane = planned_panes[i]
+                if pane is not None:
+                    pane.update_function_item(
+                        func_item, i, self._invocation_badge_text(i, func_item)
+                    )
+                    self.function_panes.append(pane)
+                    self.function_layout.addWidget(pane)
+                    continue
+
                 pane = FunctionPaneWidget(
                     func_item,
                     i,
@@ -1042,21 +1157,21 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
 
                 self.function_panes.append(pane)
                 self.function_layout.addWidget(pane)
+                created_panes.append(pane)
 
                 # Note: Scope color scheme will be applied to all panes
                 # in set_scope_color_scheme() which is called after panes are created.
                 # This avoids duplicate styling calls.
 
-                # CRITICAL FIX: Apply initial enabled styling for function panes
-                # This ensures that when a function pattern editor opens, disabled functions
-                # show as correct dimmed styling immediately, not just after toggling
-                if pane.form_manager is not None:
-                    # Use QTimer to ensure this runs after the widget is fully constructed
-                    from PyQt6.QtCore import QTimer
-
-                    QTimer.singleShot(
-                        0, lambda p=pane: self._apply_initial_enabled_styling_to_pane(p)
-                    )
+            # CRITICAL FIX: Apply initial enabled styling for function panes
+            # This ensures that when a function pattern editor opens, disabled functions
+            # show as correct dimmed styling immediately, not just after toggling.
+            # One timer runs after all new panes are fully constructed.
+            styled_panes = [pane for pane in created_panes if pane.form_manager is not None]
+            if styled_panes:
+                QTimer.singleShot(
+                    0, lambda: self._apply_initial_enabled_styling_to_panes(styled_panes)
+                )
 
         # Apply scope styling to all child widgets (GroupBoxWithHelp, HelpButton, etc.)
         # This must be done AFTER all panes are created so findChildren() finds them all
@@ -1066,16 +1181,39 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
                 pane.set_scope_color_scheme(self._scope_color_scheme)
             self._apply_scope_styling_to_children(self._scope_color_scheme)
 
-            # CRITICAL: Register callback on each pane's form_manager for async-created widgets
-            # This hooks into FormBuildOrchestrator's async completion system properly
-            for pane in self.function_panes:
+            # CRITICAL: Register callback on each new pane's form_manager for async-created
+            # widgets. This hooks into FormBuildOrchestrator's async completion system properly;
+            # reused panes registered theirs when they were created.
+            # Completions in the same event-loop turn share one child-tree pass.
+            for pane in created_panes:
                 if pane.form_manager is not None:
-                    # Capture scheme in closure
-                    scheme = self._scope_color_scheme
                     pane.form_manager._on_build_complete_callbacks.append(
-                        lambda s=scheme: self._apply_scope_styling_to_children(s)
+                        self._schedule_scope_styling
                     )
 
+    @staticmethod
+    def _is_pane_reusable(pane: FunctionPaneWidget, func_scope_prefix: Optional[str]) -> bool:
+        """Return whether a pane can be moved to a new position instead of rebuilt."""
+        if sip.isdeleted(pane) or not pane.func_scope_token:
+            return False
+        if pane.func_scope_prefix != func_scope_prefix:
+            return False
+        # A replaced ObjectState (e.g. after a function swap) needs a fresh form.
+        return (
+            pane.form_manager is None
+            or pane.form_manager.state
+            is ObjectStateRegistry.get_by_scope(pane.function_scope_id)
+        )
+
+    def _apply_initial_enabled_styling_to_panes(self, panes) -> None:
+        """Apply initial enabled styling to newly created panes in one repaint."""
+        if sip.isdeleted(self):
+            return
+        with self._batched_pane_updates():
+            for pane in panes:
+                if not sip.isdeleted(pane):
+                    self._apply_initial_enabled_styling_to_pane(pane)
+
     def _apply_initial_enabled_styling_to_pane(self, pane):
         """Apply initial enabled styling to a function pane.
 
@@ -1095,9 +1233,6 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
                     )
         except Exception as e:
             # Log error but don't crash the UI
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.warning(f"Failed to apply initial enabled styling to function pane: {e}")
 
     def setup_connections(self):
@@ -1139,6 +1274,7 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
                 mutation.refresh_ui()
             self._emit_pattern_changed()
 
+    @pyqtSlot()
     def add_function(self):
         """Add a new function (mirrors Textual TUI)."""
         # Show function selector dialog via provider
@@ -1160,6 +1296,7 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
             )
             logger.debug(f"Added function: {selected_function.__name__}")
 
+    @pyqtSlot()
     def edit_function_code(self):
         """Edit function pattern as code (simple and direct)."""
         logger.debug("Edit function code clicked - opening code editor")
@@ -1233,8 +1370,6 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
 
     def _apply_edited_pattern(self, new_pattern):
         """Apply the edited pattern back to the UI."""
-        from objectstate import ObjectStateRegistry
-
         if self._before_mutation is not None:
             self._before_mutation()
 
@@ -1247,9 +1382,14 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         """Internal implementation of apply_edited_pattern (wrapped in atomic block)."""
         try:
             self._seed_func_token_generator()
-            old_entries = self._iter_tokenized_entries(self.pattern_data, self._pattern_tokens)
+            old_by_token = self._function_values_by_token(self.pattern_data, self._pattern_tokens)
 
-            # Get the new function list BEFORE updating self.functions
+            # Get the new function list BEFORE updating self.functions.
+            # Normalized entries are indexed by token as they are produced.
+            normalized_values_by_token = (
+                FunctionPatternCodeDocumentService.normalized_values_by_token
+            )
+            new_by_token: dict[str, FunctionPatternValue] = {}
             if self.is_dict_mode:
                 if isinstance(new_pattern, dict):
                     # Normalize whole dict so all keys have stable per-entry tokens.
@@ -1272,6 +1412,7 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
                         )
                         normalized_pattern[sk] = normalized_list
                         normalized_tokens[sk] = token_list
+                        new_by_token.update(normalized_values_by_token(normalized_list, token_list))
                     new_pattern = normalized_pattern
 
                     if self.selected_pattern_key and self.selected_pattern_key in new_pattern:
@@ -1311,15 +1452,12 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
                     raise ValueError(
                         f"Expected list, callable, or (callable, dict) tuple pattern for list mode, got {type(new_pattern)}"
                     )
+                new_by_token = normalized_values_by_token(new_functions, new_current_tokens)
 
             # CRITICAL FIX: Update existing function ObjectStates with new kwargs BEFORE
             # creating new widgets. This preserves dirty detection - the ObjectState's
             # saved baseline stays the same, only the current values change.
-            if self.is_dict_mode:
-                new_entries = self._iter_tokenized_entries(new_pattern, normalized_tokens)
-            else:
-                new_entries = self._iter_tokenized_entries(new_functions, new_current_tokens)
-            self._update_function_object_states(old_entries, new_entries)
+            self._update_function_object_states(old_by_token, new_by_token)
 
             # Now update pattern_data and functions
             if self.is_dict_mode:
@@ -1353,8 +1491,8 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
 
     def _update_function_object_states(
         self,
-        old_entries: list[TokenizedFunctionEntry],
-        new_entries: list[TokenizedFunctionEntry],
+        old_by_token: dict[str, FunctionPatternValue],
+        new_by_token: dict[str, FunctionPatternValue],
     ) -> None:
         """Update existing function ObjectStates with new kwargs from code mode edit.
 
@@ -1363,19 +1501,17 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         saved baseline is preserved and changes are detected as dirty.
 
         Args:
-            old_entries: Previous tokenized function entries.
-            new_entries: New entries from code mode edit
+            old_by_token: Previous function values keyed by scope token.
+            new_by_token: New function values from code mode edit, keyed by token
         """
         self.pattern_code_documents.update_function_object_states(
             parent_scope_id=str(self.scope_id) if self.scope_id else None,
-            old_entries=old_entries,
-            new_entries=new_entries,
+            old_by_token=old_by_token,
+            new_by_token=new_by_token,
         )
 
     def _patch_lazy_constructors(self):
         """Context manager that patches lazy dataclass constructors to preserve None vs concrete distinction."""
-        from objectstate import patch_lazy_constructors
-
         return patch_lazy_constructors()
 
     def _move_function(self, index, direction):
@@ -1419,26 +1555,24 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         if not self.function_panes:
             return
 
-        # Swap panes in our tracking list
-        self.function_panes[old_index], self.function_panes[new_index] = (
-            self.function_panes[new_index],
-            self.function_panes[old_index],
-        )
-
-        # Update indices on the panes
-        for i, pane in enumerate(self.function_panes):
-            pane.index = i
-
-        from PyQt6 import sip
-
-        # Reorder widgets in layout without recreating them.
-        # insertWidget() moves an existing widget if it's already in the layout.
-        if any(sip.isdeleted(p) for p in self.function_panes):
+        # Only the two swapped panes change position; everything else stays put.
+        low_index, high_index = sorted((old_index, new_index))
+        panes = self.function_panes
+        if sip.isdeleted(panes[low_index]) or sip.isdeleted(panes[high_index]):
             self._populate_function_list()
             return
 
-        for i, pane in enumerate(self.function_panes):
-            self.function_layout.insertWidget(i, pane)
+        # Swap panes in our tracking list
+        panes[low_index], panes[high_index] = panes[high_index], panes[low_index]
+        panes[low_index].index = low_index
+        panes[high_index].index = high_index
+
+        # Reorder widgets in layout without recreating them.
+        # insertWidget() moves an existing widget if it's already in the layout;
+        # inserting the lower slot first leaves the upper pane one step away.
+        with self._batched_pane_updates():
+            self.function_layout.insertWidget(low_index, panes[low_index])
+            self.function_layout.insertWidget(high_index, panes[high_index])
 
     def _add_function_at_index(self, index):
         """Add function at specific index (mirrors Textual TUI)."""
@@ -1521,21 +1655,6 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         """Get the current pattern data (for parent widgets to access)."""
         self._update_pattern_data()  # Ensure it's up to date
 
-        def _prune_kwargs(
-            func: FunctionAuthority,
-            kwargs: FunctionKwargs,
-        ) -> FunctionKwargs:
-            param_info = SignatureAnalyzer.analyze(func) if func else {}
-            pruned: FunctionKwargs = {}
-            for key, value in kwargs.items():
-                if value is None:
-                    continue
-                default_info = param_info.get(key)
-                if default_info is not None and value == default_info.default_value:
-                    continue
-                pruned[key] = value
-            return pruned
-
         # Migration fix: Convert any integer keys to string keys for compatibility
         # with pattern detection system which always uses string component values
         if isinstance(self.pattern_data, dict):
@@ -1547,7 +1666,7 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
                     func, kwargs = PatternDataManager.extract_func_and_kwargs(item)
                     if func is None:
                         continue
-                    pruned_kwargs = _prune_kwargs(func, kwargs)
+                    pruned_kwargs = _prune_default_kwargs(func, kwargs)
                     normalized_list.append(func if not pruned_kwargs else (func, pruned_kwargs))
                 migrated_pattern[str_key] = normalized_list
             return migrated_pattern
@@ -1558,7 +1677,7 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
                 func, kwargs = PatternDataManager.extract_func_and_kwargs(item)
                 if func is None:
                     continue
-                pruned_kwargs = _prune_kwargs(func, kwargs)
+                pruned_kwargs = _prune_default_kwargs(func, kwargs)
                 normalized_list.append(func if not pruned_kwargs else (func, pruned_kwargs))
 
             if len(normalized_list) == 1 and callable(normalized_list[0]):
@@ -1601,6 +1720,19 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         """Update scope index used for styling future panes."""
         self.scope_index = scope_index
 
+    def _schedule_scope_styling(self) -> None:
+        """Queue one scope-styling pass over all children for this event-loop turn."""
+        if self._scope_styling_pending:
+            return
+        self._scope_styling_pending = True
+        QTimer.singleShot(0, self._flush_scope_styling)
+
+    def _flush_scope_styling(self) -> None:
+        if sip.isdeleted(self):
+            return
+        self._scope_styling_pending = False
+        self._apply_scope_styling_to_children(self._scope_color_scheme)
+
     def _apply_scope_styling_to_children(self, scheme: ScopeColorScheme | None) -> None:
         """Apply scope styling to all child widgets that need it.
 
@@ -1611,48 +1743,41 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         if not scheme.step_border_layers:
             return
 
-        from pyqt_reactive.widgets.shared.clickable_help_components import (
-            HelpButton,
-            HelpIndicator,
-            GroupBoxWithHelp,
-        )
-        from pyqt_reactive.widgets.shared.scope_color_utils import tint_color_perceptual
-
         # Compute accent color from scheme (same logic as ScopedBorderMixin.get_scope_accent_color)
         _, tint_idx, _ = scheme.step_border_layers[0]
         accent_color = tint_color_perceptual(scheme.base_color_rgb, tint_idx).darker(120)
 
-        # Apply to all HelpButtons
-        help_btns = self.findChildren(HelpButton)
-        logger.debug("_apply_scope_styling_to_children: found %s HelpButtons", len(help_btns))
-        for help_btn in help_btns:
-            help_btn.set_scope_accent_color(accent_color)
-
-        # Apply to all HelpIndicators
-        help_indicators = self.findChildren(HelpIndicator)
+        # One tree walk collects every styled child; styling is then applied per kind
+        # in the original order (help buttons, help indicators, group boxes).
+        help_btns = []
+        help_indicators = []
+        non_pane_groupboxes = []
+        # NOTE: Exclude function panes since they're already handled in set_scope_color_scheme()
+        pane_ids = {id(pane) for pane in self.function_panes}
+        for child in self.findChildren((HelpButton, HelpIndicator, GroupBoxWithHelp)):
+            if isinstance(child, HelpButton):
+                help_btns.append(child)
+            elif isinstance(child, HelpIndicator):
+                help_indicators.append(child)
+            elif id(child) not in pane_ids:
+                non_pane_groupboxes.append(child)
         logger.debug(
-            "_apply_scope_styling_to_children: found %s HelpIndicators",
+            "_apply_scope_styling_to_children: found %s HelpButtons, %s HelpIndicators, "
+            "%s non-pane GroupBoxWithHelp",
+            len(help_btns),
             len(help_indicators),
+            len(non_pane_groupboxes),
         )
+
+        for help_btn in help_btns:
+            help_btn.set_scope_accent_color(accent_color)
         for help_indicator in help_indicators:
             help_indicator.set_scope_accent_color(accent_color)
-
-        # Apply to all GroupBoxWithHelp (scope border pattern)
-        # NOTE: Exclude function panes since they're already handled in set_scope_color_scheme()
-        groupboxes = self.findChildren(GroupBoxWithHelp)
-        non_pane_groupboxes = [gb for gb in groupboxes if gb not in self.function_panes]
-        logger.debug(
-            "_apply_scope_styling_to_children: found %s GroupBoxWithHelp, %s non-pane",
-            len(groupboxes),
-            len(non_pane_groupboxes),
-        )
         for groupbox in non_pane_groupboxes:
             groupbox.set_scope_color_scheme(scheme)
 
     def refresh_from_context(self) -> None:
         """Refresh group_by and variable_components from live ObjectState values."""
-        from objectstate import ObjectStateRegistry
-
         scope = str(self.scope_id or "")
         if not scope:
             return
@@ -1762,6 +1887,7 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
             )
         )
 
+    @pyqtSlot()
     def show_component_selection_dialog(self):
         """Show the component selection dialog (mirrors Textual TUI)."""
         # Check if component selection is disabled
@@ -1981,6 +2107,7 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         # The component button is always created (even when render_header=False),
         # because DualEditorWindow extracts the action buttons container and
         # renders it in its own header.
+        self._last_nav_signature = None
         new_text = self._get_component_button_text()
         old_text = self.component_btn.text()
         logger.debug(
@@ -1989,7 +2116,8 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
             new_text,
             self.current_group_by,
         )
-        self.component_btn.setText(new_text)
+        if new_text != old_text:
+            self.component_btn.setText(new_text)
         self.component_btn.setEnabled(not self._is_component_button_disabled())
 
         # Navigation buttons only exist when the header is rendered.
@@ -2001,6 +2129,7 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         # Show navigation buttons only in dict mode with multiple keys.
         # Buttons exist regardless of render_header; DualEditorWindow embeds
         # the action button container when render_header=False.
+        self._last_nav_signature = None
         show_nav = (
             self.is_dict_mode and isinstance(self.pattern_data, dict) and len(self.pattern_data) > 1
         )
@@ -2008,6 +2137,14 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         self.prev_key_btn.setVisible(show_nav)
         self.next_key_btn.setVisible(show_nav)
 
+    @pyqtSlot()
+    def _on_prev_key_clicked(self) -> None:
+        self._navigate_pattern_key(-1)
+
+    @pyqtSlot()
+    def _on_next_key_clicked(self) -> None:
+        self._navigate_pattern_key(1)
+
     def _navigate_pattern_key(self, direction: int):
         """Navigate to next/previous pattern key (with looping)."""
         if not self.is_dict_mode or not isinstance(self.pattern_data, dict):
@@ -2057,9 +2194,12 @@ class FunctionListEditorWidget(DetachableActionBarHost, QWidget):
         if not isinstance(self._pattern_tokens, dict):
             return
 
+        # Stored tokens are always strings (see _load_pattern_tokens_from_state and
+        # normalize_function_list), so a plain list membership test is exact.
+        token = str(token)
         target_channel = None
         for channel_key, channel_tokens in self._pattern_tokens.items():
-            if str(token) in {str(t) for t in channel_tokens}:
+            if token in channel_tokens:
                 target_channel = str(channel_key)
                 break
 
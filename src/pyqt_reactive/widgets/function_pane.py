@@ -230,6 +230,12 @@ class FunctionPaneWidget(GroupBoxWithHelp):
 
         logger.debug(f"Function pane widget initialized for index {index}")
 
+    @property
+    def function_scope_id(self) -> str:
+        """ObjectState scope id this pane's parameter form is bound to."""
+        func_parent_scope = self.func_scope_prefix or self.scope_id or "no_scope"
+        return f"{func_parent_scope}::{self.func_scope_token}"
+
     def set_invocation_badge_text(self, badge_text: Optional[str]) -> None:
         """Render or clear the invocation/debug badge inside the pane title."""
 
@@ -447,13 +453,12 @@ class FunctionPaneWidget(GroupBoxWithHelp):
         from objectstate import ObjectState, ObjectStateRegistry
 
         parent_scope = self.scope_id or "no_scope"
-        func_parent_scope = self.func_scope_prefix or parent_scope
         token = self.func_scope_token
         if not token:
             raise RuntimeError(
                 "FunctionPaneWidget requires func_scope_token for deterministic ObjectState scope."
             )
-        func_scope_id = f"{func_parent_scope}::{token}"
+        func_scope_id = self.function_scope_id
         if self._flash_key == "":
             self._flash_key = func_scope_id
             self.register_flash_groupbox_full(self._flash_key, self)
@@ -725,6 +730,33 @@ class FunctionPaneWidget(GroupBoxWithHelp):
             raise RuntimeError("Function pane flash key was not registered")
         self.queue_flash_local(self._flash_key)
 
+    def update_function_item(
+        self,
+        func_item: Tuple[Callable, Dict],
+        index: int,
+        invocation_badge_text: Optional[str] = None,
+    ) -> None:
+        """
+        Move this pane to a new position for the same function.
+
+        The parameter form stays bound to the function's ObjectState, so only
+        the index, the kwargs mirror and the title badge need refreshing.
+
+        Args:
+            func_item: Function item tuple; its function must be this pane's function
+            index: New function index in the list
+            invocation_badge_text: Badge text for the new position
+        """
+        func, kwargs = func_item
+        if func is not self.func:
+            raise ValueError(
+                f"Cannot rebind pane for {self.func!r} to a different function {func!r}"
+            )
+        self.index = index
+        self._internal_kwargs = dict(kwargs or {})
+        self.sync_kwargs()
+        self.set_invocation_badge_text(invocation_badge_text)
+
     def update_function(self, func_item: Tuple[Callable, Dict]):
         """
         Update the function and parameters.
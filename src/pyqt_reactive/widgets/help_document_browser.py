@@ -28,6 +28,8 @@ class HelpDocumentBrowser(QTextBrowser):
         self.color_scheme = color_scheme or ColorScheme()
         self.current_document: HelpDocument | None = None
         self.setReadOnly(True)
+        # Display-only: skip recording undo history for every document swap.
+        self.setUndoRedoEnabled(False)
         self.setOpenExternalLinks(True)
         self.setOpenLinks(True)
         self.setLineWrapMode(QTextBrowser.LineWrapMode.WidgetWidth)
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, ABCMeta, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Dict, List
+from typing import Callable, ClassVar, Dict, List
 
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import (
@@ -128,6 +128,10 @@ class ZMQServerBrowserWidgetABC(QWidget, ABC, metaclass=_CombinedMeta):
     """Generic ZMQ browser UI infrastructure with domain extension hooks."""
 
     _TREE_INDENTATION_PX = 12
+    # Heartbeat fields that populate_tree does not display. A scan that only
+    # changes these keeps the rendered tree. Subclasses opt fields in; by
+    # default every heartbeat field counts as rendered.
+    UNRENDERED_PONG_FIELDS: ClassVar[tuple[str, ...]] = ()
 
     server_killed = pyqtSignal(int)
     log_file_opened = pyqtSignal(str)
@@ -158,6 +162,7 @@ class ZMQServerBrowserWidgetABC(QWidget, ABC, metaclass=_CombinedMeta):
 
         self.servers: list[BaseServerInfo] = []
         self._last_known_servers: dict[int, BaseServerInfo] = {}
+        self._rendered_servers: dict[int, PongResponse] | None = None
         self._scan_in_flight = False
         self._lifecycle_state = BrowserLifecycleState()
         self.destroyed.connect(
@@ -197,6 +202,7 @@ class ZMQServerBrowserWidgetABC(QWidget, ABC, metaclass=_CombinedMeta):
             self._cleanup_timer.stop()
             self._cleanup_timer.deleteLater()
             self._cleanup_timer = None
+        self._scan_service.close()
 
         self.on_browser_cleanup()
 
@@ -204,6 +210,7 @@ class ZMQServerBrowserWidgetABC(QWidget, ABC, metaclass=_CombinedMeta):
         super().showEvent(event)
         if self._lifecycle_state.is_cleaning_up():
             return
+        self.invalidate_rendered_servers()
         self.refresh_servers()
         if self.refresh_timer is not None:
             self.refresh_timer.start(5000)
@@ -298,6 +305,19 @@ class ZMQServerBrowserWidgetABC(QWidget, ABC, metaclass=_CombinedMeta):
         for server in servers:
             self._last_known_servers[server.port] = server
 
+        # Frozen heartbeats compare by value, so a scan that is unchanged apart
+        # from unrendered fields (in any completion order) keeps the rendered tree.
+        unrendered_fields = dict.fromkeys(self.UNRENDERED_PONG_FIELDS)
+        rendered_servers = {
+            server.port: replace(server.response, **unrendered_fields)
+            if unrendered_fields
+            else server.response
+            for server in servers
+        }
+        if rendered_servers == self._rendered_servers:
+            return
+        self._rendered_servers = rendered_servers
+
         def _rebuild_contents() -> None:
             self.populate_tree(servers)
 
@@ -313,8 +333,14 @@ class ZMQServerBrowserWidgetABC(QWidget, ABC, metaclass=_CombinedMeta):
     def _on_server_killed(self, port: int) -> None:
         if port in self._last_known_servers:
             del self._last_known_servers[port]
+        self.invalidate_rendered_servers()
+
+    def invalidate_rendered_servers(self) -> None:
+        """Force the next scan result to rebuild the tree even if unchanged."""
+        self._rendered_servers = None
 
     def _periodic_cleanup(self) -> None:
+        self.invalidate_rendered_servers()
         self.periodic_domain_cleanup()
         # Note: We intentionally do NOT clean up _last_known_servers here.
         # Servers are removed from the tree by populate_tree based on scan misses.
@@ -435,7 +461,14 @@ class ZMQServerBrowserWidgetABC(QWidget, ABC, metaclass=_CombinedMeta):
 
     @abstractmethod
     def populate_tree(self, parsed_servers: List[BaseServerInfo]) -> None:
-        """Build tree items from parsed server payloads."""
+        """Build tree items from parsed server payloads.
+
+        Not called for a scan whose heartbeats match the last rendered scan,
+        ignoring ``UNRENDERED_PONG_FIELDS``. The cache is dropped when the
+        browser is shown, on each periodic cleanup tick and when a server is
+        killed. Subclasses that render other state should call
+        ``invalidate_rendered_servers()`` when that state changes.
+        """
 
     @abstractmethod
     def periodic_domain_cleanup(self) -> None:
@@ -4,6 +4,7 @@ import inspect
 import logging
 from collections.abc import Callable
 
+from PyQt6 import sip
 from PyQt6.QtGui import QCursor, QGuiApplication
 from PyQt6.QtWidgets import (
     QDialog,
@@ -290,6 +291,19 @@ class HelpWindowManager:
     # Class-level window reference for singleton behavior
     _help_window = None
 
+    @classmethod
+    def _visible_help_window(cls) -> BaseHelpWindow | None:
+        """Return the live, visible singleton window; drop deleted references."""
+        window = cls._help_window
+        if window is None:
+            return None
+        if sip.isdeleted(window):
+            cls._help_window = None
+            return None
+        if window.isHidden():
+            return None
+        return window
+
     @classmethod
     def _position_window_near_cursor(cls, window: QDialog) -> None:
         """Position help window near the mouse cursor within screen bounds."""
@@ -328,27 +342,19 @@ class HelpWindowManager:
         """Show or refresh help for a function or class."""
         logger.debug("Showing docstring help for %r", target)
         try:
-            # Check if existing window is still valid
-            if isinstance(cls._help_window, QDialog):
-                try:
-                    if (
-                        not cls._help_window.isHidden()
-                        and isinstance(cls._help_window, DocstringHelpWindow)
-                    ):
-                        if title is None:
-                            window_title = f"Help: {help_target_display_name(target)}"
-                        else:
-                            window_title = title
-                        cls._help_window.set_help_target(target, title=window_title)
-                        cls._position_window_near_cursor(cls._help_window)
-                        cls._help_window.raise_()
-                        cls._help_window.activateWindow()
-                        return
-                    if not cls._help_window.isHidden():
-                        cls._help_window.close()
-                except RuntimeError:
-                    # Window was deleted, clear reference
-                    cls._help_window = None
+            window = cls._visible_help_window()
+            if isinstance(window, DocstringHelpWindow):
+                if title is None:
+                    window_title = f"Help: {help_target_display_name(target)}"
+                else:
+                    window_title = title
+                window.set_help_target(target, title=window_title)
+                cls._position_window_near_cursor(window)
+                window.raise_()
+                window.activateWindow()
+                return
+            if window is not None:
+                window.close()
 
             # Create new window
             cls._help_window = DocstringHelpWindow(target, title=title, parent=parent)
@@ -384,26 +390,18 @@ class HelpWindowManager:
 
             logger.debug("Showing parameter help for %s", param_name)
 
-            # Check if existing window is still valid
-            if isinstance(cls._help_window, QDialog):
-                try:
-                    if (
-                        not cls._help_window.isHidden()
-                        and isinstance(cls._help_window, ParameterHelpWindow)
-                    ):
-                        cls._help_window.set_parameter_content(
-                            help_content,
-                            title=f"Parameter: {param_name}",
-                        )
-                        cls._position_window_near_cursor(cls._help_window)
-                        cls._help_window.raise_()
-                        cls._help_window.activateWindow()
-                        return
-                    if not cls._help_window.isHidden():
-                        cls._help_window.close()
-                except RuntimeError:
-                    # Window was deleted, clear reference
-                    cls._help_window = None
+            window = cls._visible_help_window()
+            if isinstance(window, ParameterHelpWindow):
+                window.set_parameter_content(
+                    help_content,
+                    title=f"Parameter: {param_name}",
+                )
+                cls._position_window_near_cursor(window)
+                window.raise_()
+                window.activateWindow()
+                return
+            if window is not None:
+                window.close()
 
             cls._help_window = ParameterHelpWindow(
                 help_content,
@@ -266,3 +266,311 @@ def test_managed_window_reject_authorizes_before_restore(qapp, monkeypatch):
 
     assert window.restore_count == 0
     assert warnings == [("Cancel Rejected", "mutation rejected")]
+
+
+def test_poller_uses_policy_change_detection():
+    """Policies may replace structural snapshot comparison with identity checks."""
+    from pyqt_reactive.services.interval_snapshot_poller import (
+        CallbackIntervalSnapshotPollerPolicy,
+        IntervalSnapshotPoller,
+    )
+
+    snapshots = iter([{"generation": 1, "rows": [1]}, {"generation": 1, "rows": [2]}])
+    changed = []
+    poller = IntervalSnapshotPoller(
+        CallbackIntervalSnapshotPollerPolicy(
+            fetch_snapshot_fn=lambda: next(snapshots),
+            clone_snapshot_fn=dict,
+            on_snapshot_changed_fn=changed.append,
+            snapshot_changed_fn=lambda previous, current: (
+                previous is None or previous["generation"] != current["generation"]
+            ),
+        )
+    )
+
+    poller._poll_worker(0)
+    poller._poll_worker(0)
+
+    assert [snapshot["rows"] for snapshot in changed] == [[1]]
+
+
+def test_form_navigation_readiness_walks_presplit_field_path():
+    """Nested-manager readiness uses the request's once-split field path."""
+    from types import SimpleNamespace
+
+    from pyqt_reactive.services.window_navigation import (
+        FormFieldWindowNavigationDriver,
+        NavigationWaitReason,
+        RegisteredWindowNavigationRequest,
+    )
+
+    nested = SimpleNamespace(widgets={"leaf": object()}, nested_managers={})
+    form_manager = SimpleNamespace(
+        widgets={"outer": object()},
+        nested_managers={"outer": nested},
+    )
+    driver = FormFieldWindowNavigationDriver(lambda _path: None, lambda: form_manager)
+
+    ready = RegisteredWindowNavigationRequest(window=None, field_path="outer.leaf")
+    waiting = RegisteredWindowNavigationRequest(window=None, field_path="outer.inner.leaf")
+
+    assert ready.field_path_parts == ("outer", "leaf")
+    assert not driver.readiness(ready).needs_wait
+    assert driver.readiness(waiting).wait_reason is NavigationWaitReason.NESTED_MANAGER
+
+
+def test_position_window_near_cursor_avoids_widget_under_cursor(qapp, monkeypatch):
+    """Placement must step off an avoid widget that contains the cursor."""
+    from PyQt6.QtCore import QPoint, QRect
+    from PyQt6.QtGui import QGuiApplication
+    from PyQt6.QtWidgets import QWidget
+
+    from pyqt_reactive.services import window_manager
+    from pyqt_reactive.services.window_manager import WindowManager
+
+    available = QGuiApplication.primaryScreen().availableGeometry()
+    cursor = available.center()
+
+    class _Cursor:
+        @staticmethod
+        def pos():
+            return QPoint(cursor)
+
+    monkeypatch.setattr(window_manager, "QCursor", _Cursor)
+    avoid = QWidget()
+    avoid.setGeometry(cursor.x() - 100, cursor.y() - 100, 200, 200)
+    window = QWidget()
+    window.resize(120, 80)
+
+    WindowManager.position_window_near_cursor(window, avoid_widgets=(avoid,))
+
+    placed = QRect(window.pos(), window.size())
+    assert not placed.intersects(avoid.frameGeometry())
+    assert available.contains(placed.topLeft())
+
+
+def test_navigation_build_retry_fires_once_across_callback_lists(qapp, monkeypatch):
+    """A retry shared by several pending build lists re-arms navigation once."""
+    from pyqt_reactive.services import window_manager
+    from pyqt_reactive.services.window_manager import NavigationRetryScheduler
+    from pyqt_reactive.services.window_navigation import (
+        RegisteredWindowNavigationRequest,
+        WindowNavigationDriver,
+    )
+
+    root_callbacks = [lambda: None]
+    nested_callbacks = [lambda: None]
+
+    class _Driver(WindowNavigationDriver):
+        def build_complete_callbacks(self):
+            return (root_callbacks, nested_callbacks)
+
+    scheduled = []
+    monkeypatch.setattr(
+        window_manager.QTimer,
+        "singleShot",
+        lambda delay, callback: scheduled.append((delay, callback)),
+    )
+    request = RegisteredWindowNavigationRequest(window=object(), field_path="a")
+
+    assert NavigationRetryScheduler.schedule(request, _Driver(), {}, lambda: None)
+    for callback in (*root_callbacks, *nested_callbacks):
+        callback()
+
+    assert [delay for delay, _callback in scheduled] == [0]
+
+
+def test_get_open_scopes_drops_deleted_windows_in_one_pass(qapp):
+    """Deleted windows are pruned with their drivers while live scopes remain."""
+    from PyQt6 import sip
+    from PyQt6.QtWidgets import QWidget
+
+    from pyqt_reactive.services.window_manager import WindowManager
+
+    live = QWidget()
+    stale = QWidget()
+    WindowManager.register("live_scope", live)
+    WindowManager.register("stale_scope", stale)
+    try:
+        sip.delete(stale)
+
+        assert WindowManager.get_open_scopes().count("live_scope") == 1
+        assert "stale_scope" not in WindowManager.get_open_scopes()
+        assert "stale_scope" not in WindowManager._scoped_windows
+    finally:
+        WindowManager.unregister("live_scope")
+        WindowManager._scoped_windows.pop("stale_scope", None)
+
+
+def test_code_document_driver_lives_and_dies_with_its_scope(qapp):
+    """The code-document driver is dropped together with its window entry."""
+    import pytest
+    from PyQt6.QtWidgets import QWidget
+
+    from pyqt_reactive.services.window_manager import WindowManager
+
+    window = QWidget()
+    driver = object()
+    WindowManager.register("code_scope", window, code_document_driver=driver)
+    WindowManager.register("plain_scope", QWidget())
+    try:
+        assert WindowManager.require_code_document_driver("code_scope") is driver
+        assert WindowManager.get_code_document_scopes() == ["code_scope"]
+    finally:
+        WindowManager.unregister("code_scope")
+        WindowManager.unregister("plain_scope")
+
+    with pytest.raises(KeyError):
+        WindowManager.require_code_document_driver("code_scope")
+
+
+def test_position_window_near_cursor_centres_when_nothing_to_avoid(qapp, monkeypatch):
+    """Without obstacles the window is centred on the cursor within the screen."""
+    from PyQt6.QtCore import QPoint
+    from PyQt6.QtGui import QGuiApplication
+    from PyQt6.QtWidgets import QWidget
+
+    from pyqt_reactive.services import window_manager
+    from pyqt_reactive.services.window_manager import WindowManager
+
+    cursor = QGuiApplication.primaryScreen().availableGeometry().center()
+
+    class _Cursor:
+        @staticmethod
+        def pos():
+            return QPoint(cursor)
+
+    monkeypatch.setattr(window_manager, "QCursor", _Cursor)
+    monkeypatch.setattr(window_manager.QApplication, "topLevelWidgets", lambda: [])
+    window = QWidget()
+    window.resize(120, 80)
+
+    WindowManager.position_window_near_cursor(window)
+
+    assert window.pos() == QPoint(cursor.x() - 60, cursor.y() - 40)
+
+
+def test_deferred_navigate_without_target_arms_no_timer(qapp, monkeypatch):
+    """A pure focus request schedules no deferred navigation pass."""
+    from PyQt6.QtWidgets import QWidget
+
+    from pyqt_reactive.services import window_manager
+    from pyqt_reactive.services.window_manager import WindowManager
+
+    scheduled = []
+    monkeypatch.setattr(
+        window_manager.QTimer,
+        "singleShot",
+        lambda delay, callback: scheduled.append(delay),
+    )
+    window = QWidget()
+
+    WindowManager._deferred_navigate(window)
+    assert scheduled == []
+
+    WindowManager._deferred_navigate(window, item_id="3")
+    assert scheduled == [0]
+
+
+def test_solve_window_position_steps_around_obstacles():
+    """The pure placement solver moves off obstacles and caches by its inputs."""
+    from pyqt_reactive.services.window_manager import _solve_window_position
+
+    bounds = (0, 0, 1000 - 100, 800 - 100)
+    free = _solve_window_position((500, 400), 0, (100, 100), bounds, (), ())
+    blocked = _solve_window_position(
+        (500, 400), 0, (100, 100), bounds, ((450, 350, 549, 449),), ()
+    )
+    hits = _solve_window_position.cache_info().hits
+    again = _solve_window_position(
+        (500, 400), 0, (100, 100), bounds, ((450, 350, 549, 449),), ()
+    )
+
+    assert free == (450, 350)
+    assert blocked == (578, 350)
+    assert again == blocked
+    assert _solve_window_position.cache_info().hits == hits + 1
+
+
+def test_placement_reuses_last_screen_under_cursor(qapp, monkeypatch):
+    """The screen lookup is skipped while the cursor stays on the same screen."""
+    from PyQt6.QtGui import QGuiApplication
+
+    from pyqt_reactive.services import window_manager
+    from pyqt_reactive.services.window_manager import WindowManager
+
+    screen = QGuiApplication.primaryScreen()
+    cursor = screen.geometry().center()
+    lookups = []
+
+    def screen_at(pos):
+        lookups.append(pos)
+        return screen
+
+    monkeypatch.setattr(WindowManager, "_last_placement_screen", None)
+    monkeypatch.setattr(window_manager.QGuiApplication, "screenAt", screen_at)
+
+    assert WindowManager._placement_screen_at(cursor) is screen
+    assert WindowManager._placement_screen_at(cursor) is screen
+    assert lookups == [cursor]
+
+
+def test_show_or_focus_unregisters_scope_on_close(qapp):
+    """Closing a window created by show_or_focus frees its scope for reopening."""
+    from PyQt6.QtWidgets import QWidget
+
+    from pyqt_reactive.services.window_manager import WindowManager
+
+    window = WindowManager.show_or_focus("close_scope", QWidget)
+    try:
+        assert WindowManager.get_window("close_scope") is window
+        assert "closeEvent" not in vars(window)
+
+        window.close()
+
+        assert WindowManager.get_window("close_scope") is None
+    finally:
+        WindowManager.unregister("close_scope")
+
+
+def test_focus_restores_minimized_window_without_unmaximizing(qapp):
+    """Focusing clears only the minimized state of an existing window."""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtWidgets import QWidget
+
+    from pyqt_reactive.services.window_manager import WindowManager
+
+    window = QWidget()
+    window.setWindowState(
+        Qt.WindowState.WindowMaximized | Qt.WindowState.WindowMinimized
+    )
+
+    WindowManager._focus_window(window, "focus_scope")
+
+    assert not window.windowState() & Qt.WindowState.WindowMinimized
+    assert window.windowState() & Qt.WindowState.WindowMaximized
+    window.close()
+
+
+def test_tree_aggregation_registry_dispatches_and_fails_loud():
+    """Known policies aggregate; unknown ids raise instead of returning a default."""
+    import pytest
+
+    from pyqt_reactive.strategies import (
+        ExplicitPercentTreeAggregationPolicy,
+        MeanTreeAggregationPolicy,
+        TreeAggregationPolicyRegistry,
+    )
+
+    registry = TreeAggregationPolicyRegistry(
+        {
+            "mean": MeanTreeAggregationPolicy(),
+            "explicit": ExplicitPercentTreeAggregationPolicy(),
+        }
+    )
+
+    assert registry.aggregate("mean", 0.0, [10.0, 30.0]) == 20.0
+    assert registry.aggregate("mean", 50.0, []) == 0.0
+    assert registry.aggregate("explicit", 50.0, [10.0]) == 50.0
+    with pytest.raises(ValueError, match="missing"):
+        registry.aggregate("missing", 0.0, [])
@@ -9,6 +9,7 @@ from objectstate.object_state_registry import ObjectStateRegistry
 from pyqt_reactive.widgets.function_list_editor import (
     FunctionListEditorWidget,
     PatternMutation,
+    _function_signature,
 )
 
 
@@ -133,3 +134,209 @@ def test_code_pattern_authorization_precedes_atomic_edit() -> None:
         editor._apply_edited_pattern([(sample_function, {})])
 
     assert applied == []
+
+
+def test_function_signature_is_memoized_per_callable() -> None:
+    class _UnhashableCallable:
+        __hash__ = None
+
+        def __call__(self, image, sigma: float = 2.0):
+            return image
+
+    first = _function_signature(sample_function)
+
+    assert first["threshold"].default_value == 1
+    assert _function_signature(sample_function) is first
+    assert _function_signature(_UnhashableCallable())["sigma"].default_value == 2.0
+
+
+def test_pane_updates_are_batched_until_the_outermost_batch_ends(qapp) -> None:
+    from PyQt6.QtWidgets import QVBoxLayout, QWidget
+
+    editor = SimpleNamespace(function_container=QWidget())
+    layout = QVBoxLayout(editor.function_container)
+    batch = FunctionListEditorWidget._batched_pane_updates
+
+    with batch(editor):
+        assert not editor.function_container.updatesEnabled()
+        assert not layout.isEnabled()
+        with batch(editor):
+            assert not editor.function_container.updatesEnabled()
+        assert not editor.function_container.updatesEnabled()
+        assert not layout.isEnabled()
+
+    assert editor.function_container.updatesEnabled()
+    assert layout.isEnabled()
+
+
+def test_reselecting_current_key_skips_unchanged_button_refresh() -> None:
+    refreshes: list[str] = []
+    editor = SimpleNamespace(
+        is_dict_mode=True,
+        pattern_data={"1": [], "2": []},
+        selected_pattern_key="1",
+        _last_nav_signature=None,
+        _get_component_button_text=lambda: "Channel: 1",
+        _is_component_button_disabled=lambda: False,
+        _refresh_component_button=lambda: refreshes.append("component"),
+        _update_navigation_buttons=lambda: refreshes.append("navigation"),
+    )
+
+    for _ in range(3):
+        FunctionListEditorWidget._select_pattern_key(
+            editor, "1", commit_current_view=False, persist_selection=False
+        )
+
+    assert refreshes == ["component", "navigation"]
+
+    editor.pattern_data["3"] = []
+    FunctionListEditorWidget._select_pattern_key(
+        editor, "1", commit_current_view=False, persist_selection=False
+    )
+
+    assert refreshes == ["component", "navigation"] * 2
+
+    editor.selected_pattern_key = "2"
+    FunctionListEditorWidget._select_pattern_key(
+        editor, "2", commit_current_view=False, persist_selection=False
+    )
+
+    assert refreshes == ["component", "navigation"] * 3
+
+
+def test_pane_rebuild_moves_panes_whose_token_and_function_survive(qapp) -> None:
+    from PyQt6.QtWidgets import QVBoxLayout, QWidget
+
+    def other_function(image):
+        return image
+
+    class _Pane(QWidget):
+        def __init__(self, func, token: str) -> None:
+            super().__init__()
+            self.func = func
+            self.func_scope_token = token
+            self.func_scope_prefix = "plate::step"
+            self.form_manager = None
+            self.index = -1
+
+        def update_function_item(self, func_item, index, invocation_badge_text=None) -> None:
+            self.index = index
+
+    container = QWidget()
+    layout = QVBoxLayout(container)
+    kept_first = _Pane(sample_function, "t1")
+    kept_second = _Pane(other_function, "t2")
+    removed = _Pane(sample_function, "t3")
+    for pane in (kept_first, kept_second, removed):
+        layout.addWidget(pane)
+
+    editor = SimpleNamespace(
+        functions=[(other_function, {}), (sample_function, {"threshold": 2})],
+        _current_function_tokens=["t2", "t1"],
+        function_panes=[kept_first, kept_second, removed],
+        function_layout=layout,
+        _scope_color_scheme=None,
+        _get_current_function_state_parent_scope=lambda: "plate::step",
+        _is_pane_reusable=FunctionListEditorWidget._is_pane_reusable,
+        _invocation_badge_text=lambda index, func_item: None,
+    )
+
+    FunctionListEditorWidget._rebuild_function_panes(editor)
+
+    assert editor.function_panes == [kept_second, kept_first]
+    assert [pane.index for pane in editor.function_panes] == [0, 1]
+    assert [layout.itemAt(i).widget() for i in range(layout.count())] == [
+        kept_second,
+        kept_first,
+    ]
+
+
+def test_reorder_moves_only_the_swapped_panes(qapp) -> None:
+    from PyQt6.QtWidgets import QVBoxLayout, QWidget
+
+    container = QWidget()
+    layout = QVBoxLayout(container)
+    panes = [QWidget() for _ in range(4)]
+    for index, pane in enumerate(panes):
+        pane.index = index
+        layout.addWidget(pane)
+
+    editor = SimpleNamespace(
+        function_panes=list(panes),
+        function_layout=layout,
+        function_container=container,
+        _batched_pane_updates=lambda: FunctionListEditorWidget._batched_pane_updates(editor),
+    )
+
+    FunctionListEditorWidget._reorder_function_panes(editor, 2, 1)
+
+    expected = [panes[0], panes[2], panes[1], panes[3]]
+    assert editor.function_panes == expected
+    assert [pane.index for pane in expected] == [0, 1, 2, 3]
+    assert [layout.itemAt(i).widget() for i in range(layout.count())] == expected
+
+
+def test_scope_styling_requests_in_one_turn_share_one_pass(qapp) -> None:
+    from PyQt6.QtWidgets import QWidget
+
+    class _Editor(QWidget):
+        _schedule_scope_styling = FunctionListEditorWidget._schedule_scope_styling
+        _flush_scope_styling = FunctionListEditorWidget._flush_scope_styling
+
+        def __init__(self) -> None:
+            super().__init__()
+            self._scope_styling_pending = False
+            self._scope_color_scheme = "scheme"
+            self.styled: list[object] = []
+
+        def _apply_scope_styling_to_children(self, scheme) -> None:
+            self.styled.append(scheme)
+
+    editor = _Editor()
+    for _ in range(3):
+        editor._schedule_scope_styling()
+    assert editor.styled == []
+
+    qapp.processEvents()
+
+    assert editor.styled == ["scheme"]
+    editor._schedule_scope_styling()
+    qapp.processEvents()
+    assert editor.styled == ["scheme", "scheme"]
+
+
+def test_scope_styling_skips_function_panes(qapp) -> None:
+    from PyQt6.QtWidgets import QWidget
+
+    from pyqt_reactive.widgets.shared.clickable_help_components import GroupBoxWithHelp
+
+    class _Editor(QWidget):
+        _apply_scope_styling_to_children = FunctionListEditorWidget._apply_scope_styling_to_children
+
+    editor = _Editor()
+    pane = GroupBoxWithHelp("pane", parent=editor)
+    nested = GroupBoxWithHelp("nested", parent=pane)
+    editor.function_panes = [pane]
+    scheme = SimpleNamespace(step_border_layers=[(1, 0, "solid")], base_color_rgb=(80, 120, 160))
+
+    editor._apply_scope_styling_to_children(scheme)
+
+    assert nested._scope_color_scheme is scheme
+    assert pane._scope_color_scheme is not scheme
+
+
+def test_select_pattern_key_for_function_token_finds_owning_channel() -> None:
+    selected: list[str] = []
+    editor = SimpleNamespace(
+        is_dict_mode=True,
+        pattern_data={"1": [], "2": []},
+        _pattern_tokens={"1": ["a"], "2": ["b", "c"]},
+        selected_pattern_key="1",
+        _select_pattern_key=lambda key, **_kwargs: selected.append(key),
+    )
+
+    FunctionListEditorWidget.select_pattern_key_for_function_token(editor, "c")
+    FunctionListEditorWidget.select_pattern_key_for_function_token(editor, "a")
+    FunctionListEditorWidget.select_pattern_key_for_function_token(editor, "missing")
+
+    assert selected == ["2"]
@@ -0,0 +1,38 @@
+"""Ownership rules for function-pattern field paths."""
+
+from __future__ import annotations
+
+import pytest
+
+from objectstate import DottedFieldPath
+from pyqt_reactive.services.function_navigation import (
+    FUNCTION_FIELD_ROOT,
+    FunctionFieldTarget,
+    build_function_token_field_path,
+    is_function_field_path,
+    parse_function_field_target,
+)
+
+
+@pytest.mark.parametrize(
+    "field_path",
+    ["func", "func.0", "func[2]", "func.0.sigma", "function", "funcs", "x.func", ""],
+)
+def test_function_field_path_matches_dotted_ownership(field_path: str) -> None:
+    assert is_function_field_path(field_path) is DottedFieldPath(
+        FUNCTION_FIELD_ROOT
+    ).contains_path(field_path)
+
+
+def test_token_scoped_paths_and_non_strings() -> None:
+    assert is_function_field_path(build_function_token_field_path("abc"))
+    assert not is_function_field_path(None)
+
+
+def test_parse_function_field_target_is_memoized() -> None:
+    path = build_function_token_field_path("abc", "func.1.sigma")
+
+    target = parse_function_field_target(path)
+
+    assert target == FunctionFieldTarget(token="abc", index=1, base_field_path="func.1.sigma")
+    assert parse_function_field_target(path) is target
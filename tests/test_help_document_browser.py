@@ -5,6 +5,7 @@ from __future__ import annotations
 from types import SimpleNamespace
 
 import pytest
+from PyQt6 import sip
 from PyQt6.QtCore import QUrl
 from PyQt6.QtGui import QTextCursor
 
@@ -13,6 +14,7 @@ from pyqt_reactive.widgets.help_document_browser import HelpDocumentBrowser
 from pyqt_reactive.windows.help_window_manager import (
     BaseHelpWindow,
     DocstringHelpWindow,
+    HelpWindowManager,
     ParameterHelpWindow,
 )
 
@@ -292,3 +294,20 @@ def test_setting_document_moves_cursor_to_start(qapp) -> None:
     browser.set_help_document(HelpDocument("Replacement"))
 
     assert browser.textCursor().position() == 0
+
+
+def test_help_window_manager_replaces_deleted_singleton_window(qapp, monkeypatch) -> None:
+    def documented() -> None:
+        """Documented target."""
+
+    monkeypatch.setattr(HelpWindowManager, "_help_window", None)
+    HelpWindowManager.show_docstring_help(documented)
+    first_window = HelpWindowManager._help_window
+    sip.delete(first_window)
+
+    HelpWindowManager.show_docstring_help(documented)
+
+    replacement = HelpWindowManager._help_window
+    assert isinstance(replacement, DocstringHelpWindow)
+    assert replacement is not first_window
+    replacement.close()
@@ -0,0 +1,51 @@
+"""Shift+Wheel horizontal scroll filter behaviour."""
+
+from PyQt6.QtCore import QEvent, QPoint, QPointF, Qt
+from PyQt6.QtGui import QWheelEvent
+from PyQt6.QtWidgets import QLabel, QScrollArea, QWidget
+
+from pyqt_reactive.utils.scroll_filter import ShiftWheelHorizontalScrollFilter
+
+
+def _shift_wheel(delta: int) -> QWheelEvent:
+    return QWheelEvent(
+        QPointF(1, 1),
+        QPointF(1, 1),
+        QPoint(),
+        QPoint(0, delta),
+        Qt.MouseButton.NoButton,
+        Qt.KeyboardModifier.ShiftModifier,
+        Qt.ScrollPhase.NoScrollPhase,
+        False,
+    )
+
+
+def test_shift_wheel_scrolls_nearest_scroll_area_and_caches_lookup(qapp):
+    scroll_area = QScrollArea()
+    content = QLabel("x" * 400)
+    content.setFixedWidth(4000)
+    scroll_area.setWidget(content)
+    scroll_area.resize(200, 100)
+    scroll_area.show()
+    qapp.processEvents()
+    scrollbar = scroll_area.horizontalScrollBar()
+    scrollbar.setValue(500)
+    scroll_filter = ShiftWheelHorizontalScrollFilter(scroll_speed_multiplier=1.0)
+
+    assert scroll_filter.eventFilter(content, _shift_wheel(-480))
+    assert scrollbar.value() > 500
+    assert scroll_filter._scroll_area_cache[content] is scroll_area
+
+    assert not scroll_filter.eventFilter(content, QEvent(QEvent.Type.Enter))
+    scroll_filter.eventFilter(content, QEvent(QEvent.Type.ParentChange))
+    assert content not in scroll_filter._scroll_area_cache
+
+    scroll_area.close()
+
+
+def test_shift_wheel_outside_scroll_area_passes_through(qapp):
+    widget = QWidget()
+    scroll_filter = ShiftWheelHorizontalScrollFilter()
+
+    assert not scroll_filter.eventFilter(widget, _shift_wheel(120))
+    assert scroll_filter._scroll_area_cache[widget] is None
@@ -432,6 +432,51 @@ def test_editable_function_pattern_resolves_quoted_enum_annotations(qapp):
         ObjectStateRegistry.clear()
 
 
+def test_sanitize_pattern_kwargs_copies_and_rejects_scope_tokens():
+    """Sanitized kwargs are fresh dicts and never carry internal scope tokens."""
+    import pytest
+
+    from pyqt_reactive.pattern_metadata import PatternScopeToken
+    from pyqt_reactive.services.function_pattern_code_document import (
+        FunctionPatternCodeDocumentService,
+        FunctionPatternRoundTripError,
+    )
+
+    sanitize = FunctionPatternCodeDocumentService.sanitize_pattern_kwargs
+    kwargs = {"sigma": 2.0}
+
+    assert sanitize(None) == {}
+    assert sanitize({}) == {}
+    assert sanitize(kwargs) == kwargs
+    assert sanitize(kwargs) is not kwargs
+    with pytest.raises(FunctionPatternRoundTripError):
+        sanitize({PatternScopeToken.key_name(): "token"})
+
+
+def test_function_values_by_token_skips_tokenless_entries():
+    """Only entries with a sidecar token are indexed, per channel in dict mode."""
+    from pyqt_reactive.services.function_pattern_code_document import (
+        FunctionPatternCodeDocumentService,
+        FunctionPatternValue,
+    )
+
+    def blur(image, sigma: float = 1.0):
+        return image
+
+    def threshold(image):
+        return image
+
+    index = FunctionPatternCodeDocumentService.function_values_by_token
+
+    assert index([(blur, {"sigma": 2.0}), threshold], ["a", ""]) == {
+        "a": FunctionPatternValue(blur, {"sigma": 2.0}),
+    }
+    assert index({"1": [blur], "2": (threshold, {})}, {"1": ["a"], "2": ["b"]}) == {
+        "a": FunctionPatternValue(blur, {}),
+        "b": FunctionPatternValue(threshold, {}),
+    }
+
+
 def test_action_tabbed_window_body_switches_active_actions(qapp):
     """Action tab bodies expose only the current tab's actions."""
     from PyQt6.QtWidgets import QLabel, QPushButton
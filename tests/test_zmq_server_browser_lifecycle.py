@@ -1,5 +1,6 @@
 """Lifecycle coverage for the generic ZMQ server browser."""
 
+import pytest
 from PyQt6.QtCore import QCoreApplication, QEvent
 
 from pyqt_reactive.theming import ColorScheme
@@ -11,13 +12,19 @@ from pyqt_reactive.widgets.shared.zmq_server_browser_widget import (
     ZMQServerBrowserWidgetABC,
 )
 from zmqruntime import ZMQConfig
+from zmqruntime.messages import PongResponse, ProcessResourceUsage, ServerRole
 from zmqruntime.transport import get_default_transport_mode
 
 
 class _ScanService:
+    closed = False
+
     def scan_ports(self, _ports):
         return [{"port": 5000}]
 
+    def close(self) -> None:
+        self.closed = True
+
 
 class _Browser(ZMQServerBrowserWidgetABC):
     def populate_tree(self, _parsed_servers) -> None:
@@ -51,6 +58,23 @@ def test_scan_service_resolves_omitted_transport_through_transport_owner() -> No
     assert scan_service.transport_mode is get_default_transport_mode()
 
 
+def test_scan_ports_keeps_only_answering_servers(monkeypatch) -> None:
+    scan_service = ZMQServerScanService(config=ZMQConfig(), transport_mode=None)
+    monkeypatch.setattr(
+        scan_service, "ping_server", lambda port: port if port % 2 else None
+    )
+
+    assert scan_service.scan_ports([]) == []
+    assert scan_service.scan_ports([3]) == [3]
+    assert scan_service.scan_ports(range(6)) == [1, 3, 5]
+    assert scan_service.scan_ports(range(4)) == [1, 3]
+
+    scan_service.close()
+    for ports in ([], [3], range(2)):
+        with pytest.raises(RuntimeError):
+            scan_service.scan_ports(ports)
+
+
 def test_scan_completion_is_suppressed_after_cleanup(qapp, monkeypatch) -> None:
     """A scan finishing after cleanup must not emit through a dead widget."""
 
@@ -133,6 +157,27 @@ def test_browser_owns_periodic_timers(qapp) -> None:
     qapp.processEvents()
 
 
+def test_cleanup_shuts_down_scan_executor(qapp) -> None:
+    """Browser cleanup must release the scan service's worker threads."""
+
+    scan_service = ZMQServerScanService(config=ZMQConfig(), transport_mode=None)
+    browser = _Browser(
+        ports_to_scan=[5000],
+        title="Servers",
+        color_scheme=ColorScheme(),
+        scan_service=scan_service,
+    )
+
+    browser.cleanup()
+
+    assert scan_service._executor._shutdown
+    with pytest.raises(RuntimeError):
+        scan_service.scan_ports([5000])
+    browser.deleteLater()
+    QCoreApplication.sendPostedEvents(browser, QEvent.Type.DeferredDelete)
+    qapp.processEvents()
+
+
 def test_kill_completion_is_suppressed_after_cleanup(qapp, monkeypatch) -> None:
     """A kill finishing after cleanup must not emit through a dead widget."""
 
@@ -170,3 +215,106 @@ def test_kill_completion_is_suppressed_after_cleanup(qapp, monkeypatch) -> None:
     browser.deleteLater()
     QCoreApplication.sendPostedEvents(browser, QEvent.Type.DeferredDelete)
     qapp.processEvents()
+
+
+def _pong(
+    port: int,
+    *,
+    uptime: float = 1.0,
+    ready: bool = True,
+    memory_mb: float = 10.0,
+) -> PongResponse:
+    return PongResponse(
+        port=port,
+        control_port=port + 1000,
+        ready=ready,
+        server="server",
+        server_role=ServerRole.GENERIC,
+        uptime=uptime,
+        process_usage=ProcessResourceUsage(memory_mb=memory_mb, cpu_percent=1.0),
+    )
+
+
+def test_unchanged_scan_result_skips_tree_rebuild(qapp) -> None:
+    """Scans differing only in unrendered heartbeat fields keep the rendered tree."""
+
+    class _UptimeHidingBrowser(_Browser):
+        UNRENDERED_PONG_FIELDS = ("uptime",)
+
+    browser = _UptimeHidingBrowser(
+        ports_to_scan=[5000, 5001],
+        title="Servers",
+        color_scheme=ColorScheme(),
+        scan_service=_ScanService(),
+    )
+    populated = []
+    browser.populate_tree = populated.append
+
+    browser._update_server_list([_pong(5000), _pong(5001)])
+    browser._update_server_list([_pong(5001, uptime=6.0), _pong(5000, uptime=6.0)])
+    assert len(populated) == 1
+
+    browser._update_server_list([_pong(5000), _pong(5001, ready=False)])
+    assert len(populated) == 2
+
+    browser._periodic_cleanup()
+    browser._update_server_list([_pong(5000), _pong(5001, ready=False)])
+    assert len(populated) == 3
+
+    browser.cleanup()
+    browser.deleteLater()
+    QCoreApplication.sendPostedEvents(browser, QEvent.Type.DeferredDelete)
+    qapp.processEvents()
+
+
+def test_process_usage_change_rebuilds_tree(qapp) -> None:
+    """Rendered resource usage must refresh on the next scan, not the cleanup tick."""
+
+    browser = _Browser(
+        ports_to_scan=[5000],
+        title="Servers",
+        color_scheme=ColorScheme(),
+        scan_service=_ScanService(),
+    )
+    populated = []
+    browser.populate_tree = populated.append
+
+    browser._update_server_list([_pong(5000)])
+    browser._update_server_list([_pong(5000)])
+    assert len(populated) == 1
+
+    browser._update_server_list([_pong(5000, memory_mb=20.0)])
+    assert len(populated) == 2
+
+    browser.cleanup()
+    browser.deleteLater()
+    QCoreApplication.sendPostedEvents(browser, QEvent.Type.DeferredDelete)
+    qapp.processEvents()
+
+
+def test_execution_server_info_projects_execution_ids_once() -> None:
+    from zmqruntime.messages import QueuedExecutionInfo, RunningExecutionInfo
+
+    from pyqt_reactive.services.zmq_server_info import (
+        BaseServerInfo,
+        ExecutionServerInfo,
+    )
+
+    running = RunningExecutionInfo("run-1", "plate", 0.0, 1.0)
+    response = PongResponse(
+        port=5000,
+        control_port=6000,
+        ready=True,
+        server="ExecutionServer",
+        server_role=ServerRole.EXECUTION,
+        running_executions=(running,),
+        queued_executions=(QueuedExecutionInfo("queued-1", "plate", 1),),
+    )
+
+    info = BaseServerInfo.from_response(response)
+
+    assert isinstance(info, ExecutionServerInfo)
+    assert info.running_executions == ("run-1",)
+    assert info.queued_executions == ("queued-1",)
+    assert info.running_executions is info.running_executions
+    assert info == ExecutionServerInfo(response)